@@ -0,0 +1,126 @@
+import numpy as np
+import pandas as pd
+
+from scoring import COLS_ZERO
+from datastore import load_arrays
+
+# Kolom dashboard -> label tampilan
+DASHBOARD_COLUMNS = {"Glucose": "Glukosa", "BMI": "BMI", "Age": "Usia"}
+CLASS_LABELS = {0: "Tidak Diabetes", 1: "Diabetes"}
+
+
+# ===============================
+# LOAD DATA DASHBOARD
+# ===============================
+def load_dashboard_data(path):
+    """Read only the dashboard columns; zeros in medical columns become NaN"""
+    arrays = load_arrays(path, list(DASHBOARD_COLUMNS) + ["Outcome"])
+    data = pd.DataFrame({
+        col: np.asarray(arrays[col], dtype=np.float32) for col in DASHBOARD_COLUMNS
+    })
+    data["Outcome"] = np.asarray(arrays["Outcome"])
+    for col in DASHBOARD_COLUMNS:
+        if col in COLS_ZERO:
+            data[col] = data[col].replace(0, np.nan)
+    return data
+
+
+# ===============================
+# AGREGASI
+# ===============================
+def histogram(values, outcome, bins=30):
+    """Shared bin edges with per-class counts"""
+    valid = ~np.isnan(values)
+    edges = np.histogram_bin_edges(values[valid], bins=bins)
+    counts = {
+        label: np.histogram(values[valid & (outcome == label)], bins=edges)[0]
+        for label in CLASS_LABELS
+    }
+    return {"edges": edges, "counts": counts}
+
+
+def box_stats(values, label):
+    """Quartiles and 1.5 IQR whiskers in the format of Axes.bxp"""
+    values = values[~np.isnan(values)]
+    if len(values) == 0:
+        return None
+    q1, med, q3 = np.percentile(values, [25, 50, 75])
+    iqr = q3 - q1
+    inside = values[(values >= q1 - 1.5 * iqr) & (values <= q3 + 1.5 * iqr)]
+    return {
+        "label": label,
+        "q1": q1, "med": med, "q3": q3,
+        "whislo": inside.min(), "whishi": inside.max(),
+        "mean": values.mean(),
+        "fliers": np.array([])
+    }
+
+
+def risk_ratio(outcome, mask):
+    """Diabetes rate where mask holds, divided by the rate where it does not"""
+    inside, outside = outcome[mask], outcome[~mask]
+    if len(inside) == 0 or len(outside) == 0 or outside.mean() == 0:
+        return float("nan")
+    return float(inside.mean() / outside.mean())
+
+
+def compute_aggregates(data, bins=30):
+    """Everything the dashboard draws, computed once from the raw rows"""
+    outcome = data["Outcome"].to_numpy()
+    columns = {col: data[col].to_numpy(dtype=np.float64) for col in DASHBOARD_COLUMNS}
+
+    class_counts = {label: int((outcome == label).sum()) for label in CLASS_LABELS}
+
+    describe = data[list(DASHBOARD_COLUMNS)].describe().round(2)
+    describe.columns = [DASHBOARD_COLUMNS[col] for col in describe.columns]
+
+    return {
+        "n_rows": len(data),
+        "class_counts": class_counts,
+        "histograms": {
+            col: histogram(values, outcome, bins) for col, values in columns.items()
+        },
+        "box": {
+            col: [box_stats(values[outcome == label], name) for label, name in CLASS_LABELS.items()]
+            for col, values in columns.items()
+        },
+        "describe": describe,
+        "insights": {
+            "glucose_140": risk_ratio(outcome, columns["Glucose"] > 140),
+            "bmi_30": risk_ratio(outcome, columns["BMI"] > 30),
+            "age_35": risk_ratio(outcome, columns["Age"] > 35)
+        }
+    }
+
+
+# ===============================
+# DOWNSAMPLING KURVA (LTTB)
+# ===============================
+def lttb(x, y, n_out):
+    """Indices of the `n_out` points kept by Largest-Triangle-Three-Buckets
+
+    The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the previously
+    kept point and the mean of the next bucket, which preserves the visual
+    shape of a curve at a fixed point budget.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            cx, cy = x[hi:edges[i + 2]].mean(), y[hi:edges[i + 2]].mean()
+        else:
+            cx, cy = x[-1], y[-1]
+        area = np.abs((x[a] - cx) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (cy - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
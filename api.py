@@ -0,0 +1,149 @@
+"""Headless scoring service for the diabetes risk model.
+
+Jalankan dengan:
+    uvicorn api:app --host 0.0.0.0 --port 8000 --workers 4
+
+Endpoint:
+    GET  /health          -> status layanan
+    GET  /drift           -> PSI/KS fitur pasien yang diskor vs data latih (per worker)
+    POST /predict         -> satu pasien  {"Glucose": 148, "BMI": 33.6, ...}
+    POST /predict/batch   -> banyak pasien {"patients": [{...}, {...}]}
+"""
+import json
+import math
+import os
+
+import registry
+from drift import DriftMonitor
+from scoring import FEATURES, LinearScorer, risk_levels, top_drivers
+
+MODEL_PATH = os.environ.get("DIABETES_MODEL") or registry.resolve("logistic_model.json")
+MAX_BATCH = int(os.environ.get("DIABETES_MAX_BATCH", "10000"))
+
+# ===============================
+# MODEL RESIDEN (SEKALI PER WORKER, TANPA SKLEARN)
+# ===============================
+model = LinearScorer.from_json(MODEL_PATH)
+monitor = DriftMonitor.from_artifact(MODEL_PATH)
+
+
+def score_records(records):
+    """Score a list of feature dicts with one predict_proba call"""
+    rows = []
+    for i, record in enumerate(records):
+        if not isinstance(record, dict):
+            raise ValueError(f"Pasien #{i} harus berupa objek JSON")
+        missing = [col for col in FEATURES if col not in record]
+        if missing:
+            raise ValueError(f"Pasien #{i}: kolom tidak ditemukan: " + ", ".join(missing))
+        try:
+            row = [float(record[col]) for col in FEATURES]
+        except (TypeError, ValueError):
+            raise ValueError(f"Pasien #{i}: nilai fitur harus numerik") from None
+        if not all(math.isfinite(value) for value in row):
+            raise ValueError(f"Pasien #{i}: nilai fitur harus berhingga (bukan NaN/Infinity)")
+        rows.append(row)
+
+    scores = model.predict_proba(rows)[:, 1]
+    if monitor is not None:
+        monitor.update(rows)
+    levels = risk_levels(scores, model.risk_bands)
+    results = [
+        {"risk_score": round(float(score), 4), "risk_level": str(level)}
+        for score, level in zip(scores, levels)
+    ]
+    if model.baseline is not None:
+        # Kontribusi log-odds per fitur untuk seluruh batch dalam satu operasi matriks
+        contributions = model.contributions(rows).round(4)
+        drivers = top_drivers(contributions)
+        for result, row, top in zip(results, contributions.tolist(), drivers.tolist()):
+            result["contributions"] = dict(zip(FEATURES, row))
+            result["top_drivers"] = [FEATURES[j] for j in top]
+            result["contribution_scale"] = model.contribution_scale
+    return results
+
+
+# ===============================
+# ASGI
+# ===============================
+async def _read_json(receive):
+    body = b""
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get("body", b"")
+        more_body = message.get("more_body", False)
+    return json.loads(body or b"null")
+
+
+async def _respond(send, status, payload):
+    body = json.dumps(payload).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode())
+        ]
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        await _lifespan(receive, send)
+        return
+    if scope["type"] != "http":
+        return
+
+    method, path = scope["method"], scope["path"].rstrip("/") or "/"
+
+    if path == "/health":
+        await _respond(send, 200, {"status": "ok", "features": FEATURES})
+        return
+
+    if path == "/drift":
+        if monitor is None:
+            await _respond(send, 404, {"error": "Artefak model tidak memuat histogram referensi"})
+        else:
+            await _respond(send, 200, monitor.report())
+        return
+
+    if path not in ("/predict", "/predict/batch"):
+        await _respond(send, 404, {"error": "Endpoint tidak ditemukan"})
+        return
+    if method != "POST":
+        await _respond(send, 405, {"error": "Gunakan metode POST"})
+        return
+
+    try:
+        payload = await _read_json(receive)
+    except ValueError:
+        await _respond(send, 400, {"error": "Body bukan JSON yang valid"})
+        return
+
+    try:
+        if path == "/predict":
+            result = score_records([payload])[0]
+        else:
+            patients = payload.get("patients") if isinstance(payload, dict) else None
+            if not isinstance(patients, list):
+                raise ValueError("Body harus berisi daftar 'patients'")
+            if len(patients) > MAX_BATCH:
+                raise ValueError(f"Maksimal {MAX_BATCH} pasien per permintaan")
+            result = {"results": score_records(patients)}
+    except ValueError as exc:
+        await _respond(send, 422, {"error": str(exc)})
+        return
+
+    await _respond(send, 200, result)
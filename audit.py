@@ -0,0 +1,151 @@
+"""Non-blocking audit trail of scored predictions (JSON Lines).
+
+Konfigurasi lewat environment variable:
+    DIABETES_AUDIT_LOG=logs/predictions.jsonl   # file log ("" atau 0 = mati)
+    DIABETES_AUDIT_MAX_BYTES=10485760           # rotasi bila ukuran file melewati batas
+    DIABETES_AUDIT_ROTATE_SECONDS=86400         # rotasi bila file lebih tua dari N detik
+    DIABETES_AUDIT_FLUSH_INTERVAL=1             # tulis antrean paling lambat tiap N detik
+
+`log()` only puts the record on an in-memory queue; a daemon thread
+writes batches, rotates the file and gzips rotated segments, so the
+request path never touches the disk. When the queue is full the record
+is dropped and counted instead of blocking.
+"""
+import atexit
+import gzip
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from datetime import datetime, timezone
+
+import instrumentation
+
+PATH = os.environ.get("DIABETES_AUDIT_LOG", "logs/predictions.jsonl")
+ENABLED = PATH.lower() not in ("", "0", "false", "no")
+MAX_BYTES = int(os.environ.get("DIABETES_AUDIT_MAX_BYTES", str(10 * 1024 * 1024)))
+ROTATE_SECONDS = float(os.environ.get("DIABETES_AUDIT_ROTATE_SECONDS", "86400"))
+FLUSH_INTERVAL = float(os.environ.get("DIABETES_AUDIT_FLUSH_INTERVAL", "1"))
+BATCH_SIZE = 256
+QUEUE_SIZE = 10_000
+
+logger = logging.getLogger("diabetes.audit")
+_STOP = object()
+
+
+class AuditLog:
+    """Queue + background writer with size/time rotation of a JSONL file"""
+
+    def __init__(self, path=PATH, max_bytes=MAX_BYTES, rotate_seconds=ROTATE_SECONDS,
+                 flush_interval=FLUSH_INTERVAL, batch_size=BATCH_SIZE, queue_size=QUEUE_SIZE):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.rotate_seconds = rotate_seconds
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._file = None
+        self._opened_at = 0.0
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def log(self, record):
+        """Enqueue one record; never blocks the caller"""
+        record.setdefault("timestamp", datetime.now(timezone.utc).isoformat(timespec="milliseconds"))
+        try:
+            self._queue.put_nowait(record)
+        except queue.Full:
+            instrumentation.count("audit_dropped")
+
+    def close(self, timeout=5.0):
+        """Flush everything still queued and stop the writer thread"""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join(timeout)
+
+    # -------------------------------
+    # THREAD PENULIS
+    # -------------------------------
+    def _run(self):
+        while True:
+            batch, stop = self._next_batch()
+            if batch:
+                try:
+                    self._write(batch)
+                except OSError as exc:
+                    logger.warning("Log audit gagal ditulis (%d record): %s", len(batch), exc)
+                    instrumentation.count("audit_dropped", len(batch))
+            if stop:
+                if self._file is not None:
+                    self._file.close()
+                    self._file = None
+                return
+
+    def _next_batch(self):
+        """Block for the first record, then drain up to batch_size until the deadline"""
+        batch = []
+        item = self._queue.get()
+        deadline = time.monotonic() + self.flush_interval
+        while item is not _STOP:
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                return batch, False
+            try:
+                item = self._queue.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                return batch, False
+        return batch, True
+
+    def _write(self, batch):
+        if self._file is not None and self._should_rotate():
+            self._rotate()
+        if self._file is None:
+            self._open()
+        self._file.write("".join(json.dumps(record, default=str) + "\n" for record in batch))
+        self._file.flush()
+        instrumentation.count("audit_records", len(batch))
+
+    def _open(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+        self._opened_at = time.time()
+
+    def _should_rotate(self):
+        return (
+            self._file.tell() >= self.max_bytes
+            or time.time() - self._opened_at >= self.rotate_seconds
+        )
+
+    def _rotate(self):
+        """Rename the current file with a timestamp suffix and gzip it"""
+        self._file.close()
+        self._file = None
+        root, ext = os.path.splitext(self.path)
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        rotated = f"{root}-{stamp}{ext}"
+        os.replace(self.path, rotated)
+        with open(rotated, "rb") as src, gzip.open(rotated + ".gz", "wb") as dst:
+            shutil.copyfileobj(src, dst)
+        os.remove(rotated)
+        instrumentation.count("audit_rotations")
+
+
+class _NoAuditLog:
+    def log(self, record):
+        pass
+
+    def close(self, timeout=5.0):
+        pass
+
+
+def open_log(path=PATH):
+    """AuditLog for `path`, or a no-op logger when auditing is disabled"""
+    if not ENABLED:
+        return _NoAuditLog()
+    return AuditLog(path)
@@ -0,0 +1,337 @@
+"""Benchmark suite for training, scoring and page rendering.
+
+Contoh:
+    python benchmark.py                                  # semua, ukuran default
+    python benchmark.py --suite scoring --suite pages
+    python benchmark.py --suite startup                  # biaya impor & cold start
+    python benchmark.py --sizes 1000 100000 10000000     # training s/d 10 juta baris
+    python benchmark.py --compare benchmarks/results-20240101-000000.json
+
+Hasil ditulis sebagai JSON ke benchmarks/results-<timestamp>.json.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+from scoring import FEATURES, LinearScorer
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# Kandidat yang dilatih suite training; tetap sama agar waktu antar run sebanding
+TRAINING_MODELS = ["logistic"]
+RESULTS_DIR = os.path.join(ROOT, "benchmarks")
+PAGES = [
+    "💗 Overview Analisis",
+    "💗 Dashboard Utama",
+    "💗 Evaluasi Model",
+    "💗 Interpretasi Model",
+    "💗 Prediksi Baru",
+    "💗 Contact"
+]
+IMPORT_MODULES = [
+    "streamlit", "numpy", "pandas", "matplotlib.figure", "sklearn", "joblib",
+    "statsmodels.api", "scoring", "aggregates", "charts", "datastore", "registry"
+]
+HEAVY_MODULES = ["numpy", "pandas", "matplotlib", "sklearn", "scipy", "statsmodels"]
+
+
+# ===============================
+# UTILITAS
+# ===============================
+def timed(fn, repeat=5):
+    """Run fn `repeat` times; return timing summary in seconds"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    return {
+        "repeat": repeat,
+        "best": min(times),
+        "median": statistics.median(times),
+        "mean": statistics.fmean(times)
+    }
+
+
+def synthetic_dataset(path, n_rows, seed=42, chunk=1_000_000):
+    """Bootstrap diabetes.csv rows with jitter into a CSV of `n_rows` rows"""
+    base = pd.read_csv(os.path.join(ROOT, "diabetes.csv"), sep=";")
+    rng = np.random.default_rng(seed)
+    integer_cols = [col for col in base.columns if col not in ("BMI", "DiabetesPedigreeFunction")]
+    written = 0
+    with open(path, "w") as f:
+        while written < n_rows:
+            size = min(chunk, n_rows - written)
+            rows = base.iloc[rng.integers(0, len(base), size)].reset_index(drop=True)
+            # Jitter kecil, nilai nol (missing) dibiarkan nol
+            for col in base.columns.drop("Outcome"):
+                noise = rng.normal(0, 0.02 * base[col].std(), size)
+                rows[col] = np.where(rows[col] == 0, 0, np.clip(rows[col] + noise, 0, None))
+            rows[integer_cols] = rows[integer_cols].round().astype(int)
+            rows["BMI"] = rows["BMI"].round(1)
+            rows["DiabetesPedigreeFunction"] = rows["DiabetesPedigreeFunction"].round(3)
+            rows.to_csv(f, sep=";", index=False, header=written == 0)
+            written += size
+
+
+def legacy_formula(data):
+    """The hand-coded risk formula the app used before the trained model"""
+    score = (
+        data["Glucose"].to_numpy() * 0.0012 +
+        data["BMI"].to_numpy() * 0.015 +
+        data["Age"].to_numpy() * 0.008 +
+        data["Pregnancies"].to_numpy() * 0.025 +
+        (data["BloodPressure"].to_numpy() - 70) * 0.002 +
+        (data["Insulin"].to_numpy() / 100) * 0.001 +
+        data["SkinThickness"].to_numpy() * 0.001 +
+        data["DiabetesPedigreeFunction"].to_numpy() * 0.1
+    )
+    return np.clip(score, 0, 1)
+
+
+# ===============================
+# TRAINING
+# ===============================
+def bench_training(sizes, stream_above=1_000_000, extra_args=()):
+    """End-to-end `python model.py` on synthetic data in a scratch directory"""
+    results = []
+    with tempfile.TemporaryDirectory() as scratch:
+        env = {
+            **os.environ,
+            "DIABETES_REGISTRY": os.path.join(scratch, "models"),
+            "DIABETES_CACHE_DIR": os.path.join(scratch, "cache")
+        }
+        for n_rows in sizes:
+            data = os.path.join(scratch, f"synthetic-{n_rows}.csv")
+            synthetic_dataset(data, n_rows)
+            stream = n_rows > stream_above
+            cmd = [sys.executable, os.path.join(ROOT, "model.py"), "--data", data]
+            cmd += ["--stream"] if stream else ["--models", *TRAINING_MODELS]
+            cmd += list(extra_args)
+
+            start = time.perf_counter()
+            subprocess.run(cmd, cwd=scratch, env=env, check=True, capture_output=True)
+            elapsed = time.perf_counter() - start
+            results.append({
+                "rows": n_rows,
+                "mode": "stream" if stream else "batch",
+                "models": ["logistic"] if stream else TRAINING_MODELS,
+                "seconds": elapsed,
+                "rows_per_second": n_rows / elapsed
+            })
+            print(f"  training {n_rows:>11,} baris ({results[-1]['mode']}): {elapsed:8.2f} s")
+            os.remove(data)
+    return results
+
+
+# ===============================
+# SCORING
+# ===============================
+def bench_scoring(batch_sizes, repeat=5):
+    """Single-row latency and batch throughput of each scoring path"""
+    import joblib
+    import registry
+
+    model = joblib.load(os.path.join(ROOT, registry.resolve("logistic_model.pkl")))
+    artifact = os.path.join(ROOT, registry.resolve("logistic_model.json"))
+    scorer64 = LinearScorer.from_json(artifact)
+    scorer32 = LinearScorer.from_json(artifact, np.float32)
+
+    base = pd.read_csv(os.path.join(ROOT, "diabetes.csv"), sep=";").drop(columns="Outcome")
+    # (siapkan input asli tiap jalur di luar pengukuran, fungsi skor)
+    paths = {
+        "formula": (lambda X: X, legacy_formula),
+        "sklearn": (lambda X: X[FEATURES], lambda X: model.predict_proba(X)[:, 1]),
+        "numpy_float64": (lambda X: X[FEATURES].to_numpy(), lambda X: scorer64.predict_proba(X)[:, 1]),
+        "numpy_float32": (lambda X: X[FEATURES].to_numpy(), lambda X: scorer32.predict_proba(X)[:, 1])
+    }
+
+    results = {"single_row": {}, "batch": {}}
+    n_calls = 200
+    for name, (prepare, score) in paths.items():
+        one = prepare(base.iloc[[0]])
+        summary = timed(lambda: [score(one) for _ in range(n_calls)], repeat)
+        results["single_row"][name] = {
+            "microseconds_per_call": summary["median"] / n_calls * 1e6
+        }
+        print(f"  single-row {name:<14}: {results['single_row'][name]['microseconds_per_call']:10.1f} µs")
+
+    for n_rows in batch_sizes:
+        sample = base.sample(n_rows, replace=True, random_state=42).reset_index(drop=True)
+        results["batch"][str(n_rows)] = {}
+        for name, (prepare, score) in paths.items():
+            X = prepare(sample)
+            summary = timed(lambda: score(X), repeat)
+            results["batch"][str(n_rows)][name] = {
+                **summary,
+                "rows_per_second": n_rows / summary["median"]
+            }
+            print(f"  batch {n_rows:>9,} {name:<14}: {n_rows / summary['median']:14,.0f} baris/s")
+    return results
+
+
+# ===============================
+# RENDER HALAMAN (STREAMLIT AppTest)
+# ===============================
+def bench_pages(repeat=5):
+    """Cold (first) and warm rerun time of every sidebar page"""
+    from streamlit.testing.v1 import AppTest
+
+    results = {}
+    for page in PAGES:
+        app = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=300)
+        app.run()
+        start = time.perf_counter()
+        app.sidebar.radio[0].set_value(page).run()
+        cold = time.perf_counter() - start
+        if app.exception:
+            raise RuntimeError(f"{page}: {app.exception[0].message}")
+        warm = timed(lambda: app.run(), repeat)
+        results[page] = {"cold": cold, **{f"warm_{k}": v for k, v in warm.items()}}
+        print(f"  {page:<24} cold {cold * 1000:8.1f} ms   warm {warm['median'] * 1000:8.1f} ms")
+    return results
+
+
+# ===============================
+# COLD START (BIAYA IMPOR, PROSES BARU)
+# ===============================
+_COLD_PAGE = """
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+app = AppTest.from_file({app!r}, default_timeout=300)
+app.session_state["menu"] = {page!r}
+app.run()
+print(json.dumps({{
+    "seconds": time.perf_counter() - start,
+    "loaded": [m for m in {heavy!r} if m in sys.modules]
+}}))
+"""
+
+
+def import_cost(module):
+    """Cumulative import time (seconds) of `module` in a fresh interpreter"""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT, env={**os.environ, "MPLBACKEND": "Agg"},
+        check=True, capture_output=True, text=True
+    )
+    # Baris terakhir -X importtime adalah modul tingkat atas: "self | cumulative | nama"
+    for line in reversed(proc.stderr.splitlines()):
+        if line.startswith("import time:") and line.rsplit("|", 1)[1].strip() == module:
+            return int(line.split("|")[1]) / 1e6
+    return float("nan")
+
+
+def bench_startup():
+    """Per-library import cost, and cold first render of each page"""
+    results = {"imports": {}, "pages": {}}
+    for module in IMPORT_MODULES:
+        results["imports"][module] = import_cost(module)
+        print(f"  import {module:<18}: {results['imports'][module] * 1000:8.1f} ms")
+
+    for page in PAGES:
+        code = _COLD_PAGE.format(app=os.path.join(ROOT, "app.py"), page=page, heavy=HEAVY_MODULES)
+        proc = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                              check=True, capture_output=True, text=True)
+        results["pages"][page] = json.loads(proc.stdout.strip().splitlines()[-1])
+        info = results["pages"][page]
+        print(f"  cold {page:<24}: {info['seconds'] * 1000:8.1f} ms  ({', '.join(info['loaded']) or '-'})")
+    return results
+
+
+# ===============================
+# PERBANDINGAN DENGAN HASIL LAMA
+# ===============================
+def flatten(tree, prefix=""):
+    """{"a": {"b": 1}} -> {"a.b": 1} for numeric leaves"""
+    flat = {}
+    if isinstance(tree, dict):
+        for key, value in tree.items():
+            flat.update(flatten(value, f"{prefix}{key}."))
+    elif isinstance(tree, list):
+        for item in tree:
+            if isinstance(item, dict) and "rows" in item:
+                flat.update(flatten(item, f"{prefix}{item['rows']}."))
+    elif isinstance(tree, (int, float)):
+        flat[prefix[:-1]] = tree
+    return flat
+
+
+def compare(current, baseline_path, tolerance=0.10):
+    """Print metrics that moved by more than `tolerance` versus a baseline"""
+    with open(baseline_path) as f:
+        baseline = flatten(json.load(f)["results"])
+    current = flatten(current)
+    for key in sorted(set(current) & set(baseline)):
+        if baseline[key] == 0 or key.endswith(("repeat", ".rows")):
+            continue
+        ratio = current[key] / baseline[key]
+        if abs(ratio - 1) > tolerance:
+            print(f"  {key}: {baseline[key]:.6g} -> {current[key]:.6g} ({ratio:.2f}x)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark training, scoring, dan render halaman")
+    parser.add_argument("--suite", action="append", choices=["training", "scoring", "pages", "startup"],
+                        help="Bagian yang dijalankan (default: semua)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000],
+                        help="Jumlah baris dataset sintetis untuk training (s/d 10_000_000)")
+    parser.add_argument("--stream-above", type=int, default=1_000_000,
+                        help="Dataset lebih besar dari ini dilatih dengan --stream")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--output", help="File JSON hasil (default: benchmarks/results-<waktu>.json)")
+    parser.add_argument("--compare", help="JSON hasil sebelumnya untuk dibandingkan")
+    args = parser.parse_args(argv)
+
+    suites = args.suite or ["training", "scoring", "pages", "startup"]
+    results = {}
+    if "training" in suites:
+        print("Training:")
+        results["training"] = bench_training(args.sizes, args.stream_above)
+    if "scoring" in suites:
+        print("Scoring:")
+        results["scoring"] = bench_scoring(args.batch_sizes, args.repeat)
+    if "pages" in suites:
+        print("Halaman:")
+        results["pages"] = bench_pages(args.repeat)
+    if "startup" in suites:
+        print("Cold start:")
+        results["startup"] = bench_startup()
+
+    now = datetime.now(timezone.utc)
+    report = {
+        "timestamp": now.isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "versions": {
+            name: __import__(name).__version__
+            for name in ["numpy", "pandas", "sklearn", "streamlit", "matplotlib"]
+        },
+        "results": results
+    }
+
+    output = args.output or os.path.join(RESULTS_DIR, f"results-{now:%Y%m%d-%H%M%S}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    print("Hasil disimpan ke", output)
+
+    if args.compare:
+        print("Perubahan > 10% dibanding", args.compare)
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,285 @@
+import hashlib
+import io
+import pickle
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+import instrumentation
+
+# Tema bersama untuk semua grafik
+THEME = {
+    "primary": "#7b6cf6",
+    "secondary": "#ec4899",
+    "background": "white",
+    "dpi": 100
+}
+
+
+# ===============================
+# CACHE RENDER (LRU, DIBATASI)
+# ===============================
+class FigureCache:
+    """Thread-safe LRU of rendered chart bytes"""
+
+    def __init__(self, maxsize=64):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            value = self._items.get(key)
+            if value is not None:
+                self._items.move_to_end(key)
+            return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self):
+        return len(self._items)
+
+
+figure_cache = FigureCache()
+
+
+def data_key(*parts):
+    """Stable hash of the chart inputs"""
+    return hashlib.sha256(pickle.dumps(parts, protocol=4)).hexdigest()
+
+
+def render(draw, *data, fmt="png", theme=THEME):
+    """Render `draw(*data, theme=theme)` once and return the image bytes
+
+    Figures are built with matplotlib.figure.Figure rather than pyplot, so
+    they never enter pyplot's global figure registry, and each one is
+    cleared and released right after it is serialized.
+    """
+    key = (draw.__name__, fmt, data_key(data, theme))
+    instrumentation.count("cache_requests", loader="figure_cache")
+    image = figure_cache.get(key)
+    if image is not None:
+        return image
+    instrumentation.count("cache_misses", loader="figure_cache")
+
+    with instrumentation.span("figure_draw", chart=draw.__name__):
+        fig = draw(*data, theme=theme)
+    try:
+        with instrumentation.span("figure_savefig", chart=draw.__name__):
+            buffer = io.BytesIO()
+            fig.savefig(buffer, format=fmt, dpi=theme["dpi"],
+                        facecolor=theme["background"], bbox_inches="tight")
+    finally:
+        fig.clear()
+    image = buffer.getvalue()
+    figure_cache.put(key, image)
+    return image
+
+
+def _new_figure(figsize, theme, nrows=1, ncols=1):
+    # matplotlib baru diimpor saat grafik PNG pertama benar-benar digambar
+    from matplotlib.figure import Figure
+
+    fig = Figure(figsize=figsize)
+    ax = fig.subplots(nrows, ncols, squeeze=nrows * ncols == 1)
+    for axis in np.ravel(ax):
+        axis.set_facecolor(theme["background"])
+    fig.patch.set_facecolor(theme["background"])
+    return fig, ax
+
+
+# ===============================
+# DASHBOARD UTAMA
+# ===============================
+def histogram_chart(hist, xlabel, theme=THEME):
+    fig, ax = _new_figure((8, 5), theme)
+    ax.stairs(hist["counts"][1], hist["edges"], fill=True, alpha=0.7, label='Diabetes', color=theme["secondary"])
+    ax.stairs(hist["counts"][0], hist["edges"], fill=True, alpha=0.7, label='Tidak Diabetes', color=theme["primary"])
+    ax.set_xlabel(xlabel)
+    ax.set_ylabel('Frekuensi')
+    ax.legend()
+    return fig
+
+
+def box_chart(box, ylabel, theme=THEME):
+    fig, ax = _new_figure((8, 5), theme)
+    bp = ax.bxp([stats for stats in box if stats is not None],
+                showfliers=False, patch_artist=True)
+    for patch, color in zip(bp['boxes'], [theme["primary"], theme["secondary"]]):
+        patch.set_facecolor(color)
+        patch.set_alpha(0.7)
+    ax.set_ylabel(ylabel)
+    return fig
+
+
+def pie_chart(labels, counts, theme=THEME):
+    fig, ax = _new_figure((8, 5), theme)
+    ax.pie(counts, labels=labels, autopct='%1.1f%%',
+           colors=[theme["primary"], theme["secondary"]], startangle=90)
+    ax.axis('equal')  # Equal aspect ratio ensures that pie is drawn as a circle
+    return fig
+
+
+# ===============================
+# EVALUASI MODEL
+# ===============================
+def confusion_matrix_chart(cm, theme=THEME):
+    fig, ax = _new_figure((6, 5), theme)
+    im = ax.imshow(cm, interpolation='nearest', cmap='Purples')
+    fig.colorbar(im, ax=ax)
+
+    # Tampilkan teks di dalam kotak
+    thresh = cm.max() / 2.
+    for i in range(cm.shape[0]):
+        for j in range(cm.shape[1]):
+            ax.text(j, i, format(cm[i, j], 'd'),
+                    ha="center", va="center",
+                    color="white" if cm[i, j] > thresh else "black")
+
+    ax.set(xticks=np.arange(cm.shape[1]),
+           yticks=np.arange(cm.shape[0]),
+           xticklabels=['Prediksi Negatif', 'Prediksi Positif'],
+           yticklabels=['Aktual Negatif', 'Aktual Positif'],
+           ylabel='Aktual',
+           xlabel='Prediksi')
+    return fig
+
+
+def roc_chart(fpr, tpr, auc, theme=THEME):
+    fig, ax = _new_figure((8, 6), theme)
+    ax.plot(fpr, tpr, color=theme["primary"], lw=3, label=f'ROC Curve (AUC = {auc:.3f})')
+    ax.plot([0, 1], [0, 1], color='gray', lw=2, linestyle='--', label='Random')
+    ax.set_xlabel('False Positive Rate')
+    ax.set_ylabel('True Positive Rate')
+    ax.set_title('ROC Curve')
+    ax.legend(loc="lower right")
+    ax.grid(True, alpha=0.3)
+    return fig
+
+
+def pr_chart(recall, precision, average_precision, theme=THEME):
+    fig, ax = _new_figure((8, 6), theme)
+    ax.plot(recall, precision, color=theme["secondary"], lw=3,
+            label=f'PR Curve (AP = {average_precision:.3f})')
+    ax.set_xlabel('Recall')
+    ax.set_ylabel('Precision')
+    ax.set_title('Precision-Recall Curve')
+    ax.legend(loc="lower left")
+    ax.grid(True, alpha=0.3)
+    return fig
+
+
+def calibration_chart(prob_pred, prob_true, theme=THEME):
+    fig, ax = _new_figure((10, 5), theme)
+    ax.plot(prob_pred, prob_true, marker='o', color=theme["primary"], lw=3, label='Model')
+    ax.plot([0, 1], [0, 1], color='gray', lw=2, linestyle='--', label='Kalibrasi Sempurna')
+    ax.set_xlabel('Rata-rata Probabilitas Prediksi')
+    ax.set_ylabel('Proporsi Diabetes Aktual')
+    ax.legend(loc="upper left")
+    ax.grid(True, alpha=0.3)
+    return fig
+
+
+def threshold_chart(threshold, precision, recall, cost, bands, theme=THEME):
+    fig, ax = _new_figure((10, 5), theme)
+    ax.plot(threshold, precision, color=theme["primary"], lw=3, label='Presisi')
+    ax.plot(threshold, recall, color=theme["secondary"], lw=3, label='Recall')
+    ax.set_xlabel('Ambang Probabilitas')
+    ax.set_ylabel('Presisi / Recall')
+    ax.set_xlim(0, 1)
+
+    ax_cost = ax.twinx()
+    ax_cost.plot(threshold, cost, color='gray', lw=2, linestyle=':', label='Biaya per Pasien')
+    ax_cost.set_ylabel('Biaya per Pasien')
+
+    for name, color in [("medium", "#f59e0b"), ("high", "#ef4444")]:
+        ax.axvline(bands[name], color=color, lw=2, linestyle='--',
+                   label=f'{"SEDANG" if name == "medium" else "TINGGI"} > {bands[name]:.2f}')
+    lines, labels = ax.get_legend_handles_labels()
+    cost_lines, cost_labels = ax_cost.get_legend_handles_labels()
+    ax.legend(lines + cost_lines, labels + cost_labels, loc="center right")
+    ax.grid(True, alpha=0.3)
+    return fig
+
+
+# ===============================
+# INTERPRETASI MODEL
+# ===============================
+def coefficient_chart(variables, coefficients, theme=THEME):
+    fig, ax = _new_figure((12, 6), theme)
+
+    # Sort data by coefficient value
+    order = np.argsort(coefficients)
+    variables = [variables[i] for i in order]
+    coefficients = [coefficients[i] for i in order]
+
+    y_pos = np.arange(len(coefficients))
+    colors = [theme["primary"] if x >= 0 else theme["secondary"] for x in coefficients]
+
+    ax.barh(y_pos, coefficients, color=colors, alpha=0.7)
+    ax.set_yticks(y_pos)
+    ax.set_yticklabels(variables)
+    ax.set_xlabel('Koefisien Regresi')
+    ax.set_title('Koefisien Regresi Logistik')
+    ax.axvline(x=0, color='gray', linestyle='--', linewidth=1)
+
+    # Add value labels
+    for i, v in enumerate(coefficients):
+        ax.text(v + 0.001 if v >= 0 else v - 0.01,
+                i,
+                f'{v:.3f}',
+                va='center',
+                fontweight='bold')
+    return fig
+
+
+# ===============================
+# PREDIKSI BARU
+# ===============================
+def what_if_chart(curves, bands, theme=THEME):
+    """One risk curve per feature; the marker is the patient's current value"""
+    ncols = 3
+    nrows = -(-len(curves) // ncols)
+    fig, axes = _new_figure((12, 3.5 * nrows), theme, nrows, ncols)
+    axes = axes.ravel()
+    for ax, (label, curve) in zip(axes, curves.items()):
+        ax.plot(curve["grid"], curve["risk"], color=theme["primary"], lw=2.5)
+        ax.plot([curve["current"]], [curve["current_risk"]], "o", color=theme["secondary"], ms=8)
+        for name, color in [("medium", "#f59e0b"), ("high", "#ef4444")]:
+            ax.axhline(bands[name], color=color, lw=1.5, linestyle='--')
+        ax.set_title(label)
+        ax.set_ylim(0, 1)
+        ax.grid(True, alpha=0.3)
+    for ax in axes[:len(curves)][::ncols]:
+        ax.set_ylabel('Risiko Diabetes')
+    for ax in axes[len(curves):]:
+        ax.set_visible(False)
+    fig.tight_layout()
+    return fig
+
+
+# ===============================
+# PEMANTAUAN DRIFT
+# ===============================
+def drift_chart(labels, reference, current, theme=THEME):
+    fig, ax = _new_figure((10, 4.5), theme)
+    x = np.arange(len(labels))
+    ax.bar(x - 0.2, reference, width=0.4, color=theme["primary"], alpha=0.8, label='Data Latih')
+    ax.bar(x + 0.2, current, width=0.4, color=theme["secondary"], alpha=0.8, label='Pasien Diskor')
+    ax.set_xticks(x)
+    ax.set_xticklabels(labels, rotation=30, ha='right')
+    ax.set_ylabel('Proporsi')
+    ax.legend()
+    ax.grid(True, axis='y', alpha=0.3)
+    fig.tight_layout()
+    return fig
@@ -0,0 +1,170 @@
+"""Columnar binary cache for the ';'-separated datasets.
+
+The CSV is parsed once into one memory-mappable .npy file per column with
+the smallest dtype that holds it (e.g. uint8 for Pregnancies/Outcome,
+float32 for BMI). The cache is rebuilt only when the source file's size or
+mtime changes.
+"""
+import hashlib
+import json
+import os
+import shutil
+
+import numpy as np
+
+# pandas hanya diimpor saat konversi CSV atau saat DataFrame diminta;
+# load_arrays() dari cache yang segar cukup dengan numpy.
+
+CACHE_DIR = os.environ.get("DIABETES_CACHE_DIR", os.path.join(".cache", "columnar"))
+MANIFEST = "manifest.json"
+FORMAT_VERSION = 1
+
+
+# ===============================
+# LOKASI & KESEGARAN CACHE
+# ===============================
+def cache_path(source, cache_dir=CACHE_DIR):
+    """Cache directory of one source file (keyed by its absolute path)"""
+    source = os.path.abspath(source)
+    digest = hashlib.sha1(source.encode()).hexdigest()[:12]
+    stem = os.path.splitext(os.path.basename(source))[0]
+    return os.path.join(cache_dir, f"{stem}-{digest}")
+
+
+def source_signature(source):
+    stat = os.stat(source)
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def read_manifest(source, cache_dir=CACHE_DIR):
+    try:
+        with open(os.path.join(cache_path(source, cache_dir), MANIFEST)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_fresh(source, cache_dir=CACHE_DIR):
+    manifest = read_manifest(source, cache_dir)
+    return (
+        manifest is not None
+        and manifest.get("format_version") == FORMAT_VERSION
+        and manifest.get("source") == source_signature(source)
+    )
+
+
+# ===============================
+# KONVERSI CSV -> .npy PER KOLOM
+# ===============================
+def compact_dtype(minimum, maximum, integral):
+    """Smallest dtype for a column given its range"""
+    if not integral:
+        return np.dtype(np.float32)
+    for dtype in (np.uint8, np.uint16, np.uint32) if minimum >= 0 else (np.int8, np.int16, np.int32):
+        info = np.iinfo(dtype)
+        if info.min <= minimum and maximum <= info.max:
+            return np.dtype(dtype)
+    return np.dtype(np.int64)
+
+
+def convert(source, cache_dir=CACHE_DIR, chunksize=500_000):
+    """Parse `source` once and write the columnar cache; return the manifest"""
+    import pandas as pd
+
+    # Pass 1: jumlah baris, rentang nilai, dan apakah kolom bulat
+    n_rows = 0
+    ranges = {}
+    for chunk in pd.read_csv(source, sep=";", chunksize=chunksize):
+        for col in chunk.columns:
+            values = chunk[col].to_numpy(dtype=np.float64)
+            lo, hi, integral = ranges.get(col, (np.inf, -np.inf, True))
+            integral = integral and not np.isnan(values).any() and bool(np.all(values == np.round(values)))
+            if len(values):
+                lo, hi = min(lo, np.nanmin(values)), max(hi, np.nanmax(values))
+            ranges[col] = (lo, hi, integral)
+        n_rows += len(chunk)
+
+    dtypes = {col: compact_dtype(lo, hi, integral) for col, (lo, hi, integral) in ranges.items()}
+
+    # Pass 2: tulis ke direktori sementara, lalu ganti cache lama sekaligus
+    target = cache_path(source, cache_dir)
+    staging = f"{target}.tmp{os.getpid()}"
+    shutil.rmtree(staging, ignore_errors=True)
+    os.makedirs(staging)
+
+    arrays = {
+        col: np.lib.format.open_memmap(
+            os.path.join(staging, f"{col}.npy"), mode="w+", dtype=dtype, shape=(n_rows,)
+        )
+        for col, dtype in dtypes.items()
+    }
+    offset = 0
+    for chunk in pd.read_csv(source, sep=";", chunksize=chunksize):
+        for col, array in arrays.items():
+            array[offset:offset + len(chunk)] = chunk[col].to_numpy()
+        offset += len(chunk)
+    for array in arrays.values():
+        array.flush()
+    del arrays
+
+    manifest = {
+        "format_version": FORMAT_VERSION,
+        "source": source_signature(source),
+        "n_rows": n_rows,
+        "columns": {col: dtype.str for col, dtype in dtypes.items()}
+    }
+    with open(os.path.join(staging, MANIFEST), "w") as f:
+        json.dump(manifest, f, indent=2)
+
+    shutil.rmtree(target, ignore_errors=True)
+    try:
+        os.replace(staging, target)
+    except OSError:
+        # Proses lain sudah memasang cache yang sama lebih dulu
+        shutil.rmtree(staging, ignore_errors=True)
+        if not is_fresh(source, cache_dir):
+            raise
+    return manifest
+
+
+def ensure_cache(source, cache_dir=CACHE_DIR):
+    """Return the manifest, converting only when the source changed"""
+    if not is_fresh(source, cache_dir):
+        return convert(source, cache_dir)
+    return read_manifest(source, cache_dir)
+
+
+# ===============================
+# BACA CACHE
+# ===============================
+def load_arrays(source, columns=None, cache_dir=CACHE_DIR):
+    """Memory-mapped read-only arrays per column"""
+    manifest = ensure_cache(source, cache_dir)
+    directory = cache_path(source, cache_dir)
+    columns = list(manifest["columns"]) if columns is None else columns
+    missing = [col for col in columns if col not in manifest["columns"]]
+    if missing:
+        raise KeyError("Kolom tidak ditemukan: " + ", ".join(missing))
+    return {
+        col: np.load(os.path.join(directory, f"{col}.npy"), mmap_mode="r")
+        for col in columns
+    }
+
+
+def load_frame(source, columns=None, cache_dir=CACHE_DIR):
+    """DataFrame view of the columnar cache (drop-in for pd.read_csv(sep=';'))"""
+    import pandas as pd
+
+    return pd.DataFrame(load_arrays(source, columns, cache_dir), copy=False)
+
+
+def iter_frames(source, columns=None, chunksize=100_000, cache_dir=CACHE_DIR):
+    """Yield (row_offset, DataFrame) slices straight from the memory maps"""
+    import pandas as pd
+
+    arrays = load_arrays(source, columns, cache_dir)
+    n_rows = len(next(iter(arrays.values()))) if arrays else 0
+    for offset in range(0, n_rows, chunksize):
+        yield offset, pd.DataFrame(
+            {col: np.asarray(array[offset:offset + chunksize]) for col, array in arrays.items()}
+        )
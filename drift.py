@@ -0,0 +1,141 @@
+"""Feature-drift monitoring against the training distribution.
+
+model.py stores, per feature, the decile cut points of the training data
+and the row count in every bin ("reference" in logistic_model.json).
+DriftMonitor keeps one running count per bin for the scored traffic, so
+memory stays fixed (features x bins integers) no matter how many rows
+are fed in, and no raw rows are retained.
+
+    PSI = sum((cur% - ref%) * ln(cur% / ref%))    < 0.1 stabil, < 0.25 waspada, selain itu drift
+    KS  = max |CDF_ref - CDF_cur| over the bin edges (binned Kolmogorov-Smirnov)
+"""
+import json
+import threading
+import time
+
+import numpy as np
+
+from scoring import FEATURES
+
+REFERENCE_BINS = 10
+PSI_WARN = 0.1
+PSI_DRIFT = 0.25
+# Di bawah jumlah baris ini PSI/KS terlalu berisik untuk diberi status
+MIN_ROWS = 100
+# Proporsi minimum per bin agar PSI tetap terdefinisi untuk bin kosong
+EPSILON = 1e-4
+
+
+# ===============================
+# REFERENSI (SAAT TRAINING)
+# ===============================
+def reference_histograms(X, features=FEATURES, bins=REFERENCE_BINS):
+    """Quantile cut points and bin counts of every training feature
+
+    Bins are open-ended at both sides: bin 0 is x < cuts[0], bin i is
+    cuts[i-1] <= x < cuts[i], the last bin is x >= cuts[-1].
+    """
+    quantiles = np.linspace(0, 1, bins + 1)[1:-1]
+    histograms = {}
+    for col in features:
+        values = np.asarray(X[col], dtype=np.float64)
+        values = values[~np.isnan(values)]
+        cuts = np.unique(np.quantile(values, quantiles))
+        counts = np.bincount(np.searchsorted(cuts, values, side="right"), minlength=len(cuts) + 1)
+        histograms[col] = {"cuts": cuts.tolist(), "counts": counts.tolist()}
+    return {"n_rows": int(len(X)), "features": histograms}
+
+
+# ===============================
+# STATISTIK DRIFT
+# ===============================
+def psi(reference, current):
+    """Population stability index between two count vectors on the same bins"""
+    ref = np.maximum(reference / max(reference.sum(), 1), EPSILON)
+    cur = np.maximum(current / max(current.sum(), 1), EPSILON)
+    return float(np.sum((cur - ref) * np.log(cur / ref)))
+
+
+def binned_ks(reference, current):
+    """Largest CDF gap between two count vectors on the same bins"""
+    ref = np.cumsum(reference) / max(reference.sum(), 1)
+    cur = np.cumsum(current) / max(current.sum(), 1)
+    return float(np.max(np.abs(ref - cur)))
+
+
+def bin_labels(cuts):
+    """Readable label of every bin for the given cut points"""
+    cuts = [f"{cut:g}" for cut in cuts]
+    return [f"< {cuts[0]}"] + [f"{a}–{b}" for a, b in zip(cuts, cuts[1:])] + [f"≥ {cuts[-1]}"]
+
+
+def status(value):
+    if value < PSI_WARN:
+        return "stabil"
+    if value < PSI_DRIFT:
+        return "waspada"
+    return "drift"
+
+
+# ===============================
+# MONITOR BERJALAN
+# ===============================
+class DriftMonitor:
+    """Running histograms of scored rows on the training bins (thread-safe)"""
+
+    def __init__(self, reference, features=FEATURES):
+        self.features = [col for col in features if col in reference["features"]]
+        self.cuts = [np.asarray(reference["features"][col]["cuts"]) for col in self.features]
+        self.reference = [np.asarray(reference["features"][col]["counts"], dtype=np.int64)
+                          for col in self.features]
+        self._lock = threading.Lock()
+        self.reset()
+
+    @classmethod
+    def from_artifact(cls, path):
+        """Monitor for a JSON artifact, or None when it has no reference histograms"""
+        with open(path) as f:
+            reference = json.load(f).get("reference")
+        return cls(reference) if reference else None
+
+    def reset(self):
+        with self._lock:
+            self.counts = [np.zeros_like(ref) for ref in self.reference]
+            self.n_rows = 0
+            self.since = time.time()
+
+    def update(self, X):
+        """Add a batch of rows (DataFrame with the feature columns or 2-D array in FEATURES order)"""
+        if hasattr(X, "columns"):
+            X = X[self.features].to_numpy(dtype=np.float64)
+        else:
+            X = np.array(X, dtype=np.float64, ndmin=2).reshape(-1, len(FEATURES))
+            X = X[:, [FEATURES.index(col) for col in self.features]]
+        increments = []
+        for j, cuts in enumerate(self.cuts):
+            values = X[:, j]
+            values = values[~np.isnan(values)]
+            increments.append(np.bincount(np.searchsorted(cuts, values, side="right"),
+                                          minlength=len(cuts) + 1))
+        with self._lock:
+            for counts, increment in zip(self.counts, increments):
+                counts += increment
+            self.n_rows += len(X)
+
+    def report(self):
+        """Per-feature PSI, binned KS, status and both distributions"""
+        with self._lock:
+            counts = [c.copy() for c in self.counts]
+            n_rows, since = self.n_rows, self.since
+        features = {}
+        for col, cuts, ref, cur in zip(self.features, self.cuts, self.reference, counts):
+            value = psi(ref, cur) if n_rows else 0.0
+            features[col] = {
+                "psi": value,
+                "ks": binned_ks(ref, cur) if n_rows else 0.0,
+                "status": status(value) if n_rows >= MIN_ROWS else "sampel kecil",
+                "cuts": cuts.tolist(),
+                "reference": (ref / max(ref.sum(), 1)).tolist(),
+                "current": (cur / max(cur.sum(), 1)).tolist()
+            }
+        return {"n_rows": n_rows, "since": since, "features": features}
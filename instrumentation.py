@@ -0,0 +1,228 @@
+"""Opt-in timing spans and counters for the Streamlit app.
+
+Aktifkan dengan environment variable:
+    DIABETES_METRICS=1                    # rekam span & counter
+    DIABETES_METRICS_PORT=9464            # endpoint Prometheus di /metrics (0 = mati)
+    DIABETES_METRICS_LOG_INTERVAL=60      # ringkasan p50/p95/p99 ke log tiap N detik (0 = mati)
+
+When disabled every call is a no-op, so the hooks can stay in the hot path.
+"""
+import logging
+import os
+import threading
+import time
+from collections import defaultdict, deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ENABLED = os.environ.get("DIABETES_METRICS", "").lower() not in ("", "0", "false", "no")
+PORT = int(os.environ.get("DIABETES_METRICS_PORT", "9464"))
+LOG_INTERVAL = float(os.environ.get("DIABETES_METRICS_LOG_INTERVAL", "0"))
+WINDOW = 2048
+QUANTILES = (0.5, 0.95, 0.99)
+PREFIX = "diabetes"
+
+logger = logging.getLogger("diabetes.metrics")
+
+
+# ===============================
+# PENYIMPANAN METRIK
+# ===============================
+class Metrics:
+    """Span durations (sliding window per series) and monotonic counters"""
+
+    def __init__(self, window=WINDOW):
+        self.window = window
+        self._lock = threading.Lock()
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+        self._totals = defaultdict(lambda: [0, 0.0])
+        self._counters = defaultdict(int)
+
+    def observe(self, key, seconds):
+        with self._lock:
+            self._samples[key].append(seconds)
+            total = self._totals[key]
+            total[0] += 1
+            total[1] += seconds
+
+    def increment(self, key, amount=1):
+        with self._lock:
+            self._counters[key] += amount
+
+    def snapshot(self):
+        """(spans, counters); spans map key -> (count, sum, {quantile: value})"""
+        import numpy as np
+
+        with self._lock:
+            samples = {key: np.fromiter(values, float) for key, values in self._samples.items()}
+            totals = {key: tuple(value) for key, value in self._totals.items()}
+            counters = dict(self._counters)
+        spans = {
+            key: (*totals[key], dict(zip(QUANTILES, np.quantile(values, QUANTILES))))
+            for key, values in samples.items() if len(values)
+        }
+        return spans, counters
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+            self._totals.clear()
+            self._counters.clear()
+
+
+metrics = Metrics()
+
+
+def _key(name, labels):
+    return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+# ===============================
+# SPAN & COUNTER
+# ===============================
+class Span:
+    """Times from construction until stop() or the end of a `with` block"""
+
+    __slots__ = ("key", "start")
+
+    def __init__(self, key):
+        self.key = key
+        self.start = time.perf_counter()
+
+    def stop(self):
+        if self.start is not None:
+            metrics.observe(self.key, time.perf_counter() - self.start)
+            self.start = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class _NoSpan:
+    __slots__ = ()
+
+    def stop(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+
+_NO_SPAN = _NoSpan()
+
+
+def span(name, **labels):
+    """Timing span; usable as a context manager or started/stopped by hand"""
+    if not ENABLED:
+        return _NO_SPAN
+    return Span(_key(name, labels))
+
+
+def count(name, amount=1, **labels):
+    """Increment counter `<prefix>_<name>_total`"""
+    if ENABLED:
+        metrics.increment(_key(name, labels), amount)
+
+
+# ===============================
+# FORMAT PROMETHEUS
+# ===============================
+def _escape(value):
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(pairs):
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in pairs) + "}"
+
+
+def render_prometheus():
+    """All spans as one summary family plus one counter family per name"""
+    spans, counters = metrics.snapshot()
+    lines = [
+        f"# HELP {PREFIX}_span_seconds Wall-clock duration of instrumented app blocks",
+        f"# TYPE {PREFIX}_span_seconds summary"
+    ]
+    for (name, labels), (n, total, quantiles) in sorted(spans.items()):
+        base = (("span", name),) + labels
+        for q, value in quantiles.items():
+            lines.append(f"{PREFIX}_span_seconds{_labels(base + (('quantile', str(q)),))} {value:.6g}")
+        lines.append(f"{PREFIX}_span_seconds_sum{_labels(base)} {total:.6g}")
+        lines.append(f"{PREFIX}_span_seconds_count{_labels(base)} {n}")
+
+    families = defaultdict(list)
+    for (name, labels), value in counters.items():
+        families[name].append((labels, value))
+    for name, series in sorted(families.items()):
+        lines.append(f"# TYPE {PREFIX}_{name}_total counter")
+        for labels, value in sorted(series):
+            lines.append(f"{PREFIX}_{name}_total{_labels(labels)} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def log_summary():
+    """Write one p50/p95/p99 line per span and the counters to the log"""
+    spans, counters = metrics.snapshot()
+    for (name, labels), (n, total, q) in sorted(spans.items()):
+        logger.info(
+            "%s%s n=%d p50=%.1fms p95=%.1fms p99=%.1fms",
+            name, _labels(labels), n, q[0.5] * 1000, q[0.95] * 1000, q[0.99] * 1000
+        )
+    for (name, labels), value in sorted(counters.items()):
+        logger.info("%s%s %d", name, _labels(labels), value)
+
+
+# ===============================
+# EKSPOR (ENDPOINT HTTP / LOG BERKALA)
+# ===============================
+class _Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        if self.path.rstrip("/") != "/metrics":
+            self.send_error(404)
+            return
+        body = render_prometheus().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+_setup_lock = threading.Lock()
+_exporters = {}
+
+
+def _log_loop(interval):
+    while True:
+        time.sleep(interval)
+        log_summary()
+
+
+def setup(port=PORT, log_interval=LOG_INTERVAL):
+    """Start the configured exporters once per process (no-op when disabled)"""
+    if not ENABLED:
+        return
+    with _setup_lock:
+        if port and "http" not in _exporters:
+            try:
+                server = ThreadingHTTPServer(("", port), _Handler)
+            except OSError as exc:
+                logger.warning("Endpoint metrik port %s tidak bisa dibuka: %s", port, exc)
+                server = None
+            if server is not None:
+                server.daemon_threads = True
+                threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+            _exporters["http"] = server
+        if log_interval and "log" not in _exporters:
+            thread = threading.Thread(target=_log_loop, args=(log_interval,), name="metrics-log", daemon=True)
+            thread.start()
+            _exporters["log"] = thread
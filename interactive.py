@@ -0,0 +1,161 @@
+"""Client-side (Plotly) versions of the dashboard and evaluation charts.
+
+Every builder takes the same pre-aggregated inputs as its matplotlib twin
+in charts.py (histogram bin counts, box-plot quantiles, LTTB-reduced
+ROC/PR points), so the JSON sent to the browser stays small no matter how
+many rows the dataset has.
+"""
+import numpy as np
+import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+
+from charts import THEME, FigureCache, data_key
+
+figure_cache = FigureCache()
+
+
+def render(draw, *data, theme=THEME):
+    """Build `draw(*data, theme=theme)` once per distinct input"""
+    key = (draw.__name__, data_key(data, theme))
+    fig = figure_cache.get(key)
+    if fig is None:
+        fig = draw(*data, theme=theme)
+        figure_cache.put(key, fig)
+    return fig
+
+
+def _layout(fig, theme, **axes):
+    fig.update_layout(
+        paper_bgcolor=theme["background"],
+        plot_bgcolor=theme["background"],
+        margin=dict(l=10, r=10, t=40, b=10),
+        legend=dict(orientation="h", y=1.1),
+        **axes
+    )
+    return fig
+
+
+# ===============================
+# DASHBOARD UTAMA
+# ===============================
+def histogram_chart(hist, xlabel, theme=THEME):
+    edges = np.asarray(hist["edges"])
+    centers, widths = (edges[:-1] + edges[1:]) / 2, np.diff(edges)
+    fig = go.Figure()
+    for label, name, color in [(1, "Diabetes", theme["secondary"]), (0, "Tidak Diabetes", theme["primary"])]:
+        fig.add_bar(x=centers, y=hist["counts"][label], width=widths, name=name,
+                    marker_color=color, opacity=0.7)
+    return _layout(fig, theme, barmode="overlay", bargap=0,
+                   xaxis_title=xlabel, yaxis_title="Frekuensi")
+
+
+def box_chart(box, ylabel, theme=THEME):
+    fig = go.Figure()
+    for stats, color in zip(box, [theme["primary"], theme["secondary"]]):
+        if stats is None:
+            continue
+        fig.add_box(
+            name=stats["label"], x=[stats["label"]],
+            q1=[stats["q1"]], median=[stats["med"]], q3=[stats["q3"]],
+            lowerfence=[stats["whislo"]], upperfence=[stats["whishi"]], mean=[stats["mean"]],
+            marker_color=color, fillcolor=color, opacity=0.7
+        )
+    return _layout(fig, theme, showlegend=False, yaxis_title=ylabel)
+
+
+def pie_chart(labels, counts, theme=THEME):
+    fig = go.Figure(go.Pie(
+        labels=labels, values=counts, sort=False, direction="clockwise", rotation=90,
+        marker_colors=[theme["primary"], theme["secondary"]], textinfo="label+percent"
+    ))
+    return _layout(fig, theme)
+
+
+# ===============================
+# EVALUASI MODEL
+# ===============================
+def confusion_matrix_chart(cm, theme=THEME):
+    fig = go.Figure(go.Heatmap(
+        z=cm, x=["Prediksi Negatif", "Prediksi Positif"], y=["Aktual Negatif", "Aktual Positif"],
+        text=cm, texttemplate="%{text:d}", colorscale="Purples"
+    ))
+    return _layout(fig, theme, xaxis_title="Prediksi", yaxis_title="Aktual",
+                   yaxis_autorange="reversed")
+
+
+def roc_chart(fpr, tpr, auc, theme=THEME):
+    fig = go.Figure()
+    fig.add_scatter(x=fpr, y=tpr, mode="lines", name=f"ROC Curve (AUC = {auc:.3f})",
+                    line=dict(color=theme["primary"], width=3))
+    fig.add_scatter(x=[0, 1], y=[0, 1], mode="lines", name="Random",
+                    line=dict(color="gray", width=2, dash="dash"))
+    return _layout(fig, theme, title="ROC Curve",
+                   xaxis_title="False Positive Rate", yaxis_title="True Positive Rate")
+
+
+def pr_chart(recall, precision, average_precision, theme=THEME):
+    fig = go.Figure()
+    fig.add_scatter(x=recall, y=precision, mode="lines",
+                    name=f"PR Curve (AP = {average_precision:.3f})",
+                    line=dict(color=theme["secondary"], width=3))
+    return _layout(fig, theme, title="Precision-Recall Curve",
+                   xaxis_title="Recall", yaxis_title="Precision")
+
+
+def calibration_chart(prob_pred, prob_true, theme=THEME):
+    fig = go.Figure()
+    fig.add_scatter(x=prob_pred, y=prob_true, mode="lines+markers", name="Model",
+                    line=dict(color=theme["primary"], width=3))
+    fig.add_scatter(x=[0, 1], y=[0, 1], mode="lines", name="Kalibrasi Sempurna",
+                    line=dict(color="gray", width=2, dash="dash"))
+    return _layout(fig, theme, xaxis_title="Rata-rata Probabilitas Prediksi",
+                   yaxis_title="Proporsi Diabetes Aktual")
+
+
+def threshold_chart(threshold, precision, recall, cost, bands, theme=THEME):
+    fig = go.Figure()
+    fig.add_scatter(x=threshold, y=precision, mode="lines", name="Presisi",
+                    line=dict(color=theme["primary"], width=3))
+    fig.add_scatter(x=threshold, y=recall, mode="lines", name="Recall",
+                    line=dict(color=theme["secondary"], width=3))
+    fig.add_scatter(x=threshold, y=cost, mode="lines", name="Biaya per Pasien", yaxis="y2",
+                    line=dict(color="gray", width=2, dash="dot"))
+    for name, label, color in [("medium", "SEDANG", "#f59e0b"), ("high", "TINGGI", "#ef4444")]:
+        fig.add_vline(x=bands[name], line=dict(color=color, width=2, dash="dash"),
+                      annotation_text=f"{label} > {bands[name]:.2f}")
+    return _layout(fig, theme, xaxis_title="Ambang Probabilitas", xaxis_range=[0, 1],
+                   yaxis_title="Presisi / Recall",
+                   yaxis2=dict(title="Biaya per Pasien", overlaying="y", side="right"))
+
+
+# ===============================
+# PREDIKSI BARU
+# ===============================
+def what_if_chart(curves, bands, theme=THEME):
+    ncols = 3
+    nrows = -(-len(curves) // ncols)
+    fig = make_subplots(rows=nrows, cols=ncols, subplot_titles=list(curves),
+                        shared_yaxes=True, vertical_spacing=0.15)
+    for i, curve in enumerate(curves.values()):
+        row, col = i // ncols + 1, i % ncols + 1
+        fig.add_scatter(x=curve["grid"], y=curve["risk"], mode="lines", showlegend=False,
+                        line=dict(color=theme["primary"], width=3), row=row, col=col)
+        fig.add_scatter(x=[curve["current"]], y=[curve["current_risk"]], mode="markers",
+                        showlegend=False, marker=dict(color=theme["secondary"], size=10),
+                        row=row, col=col)
+        for name, color in [("medium", "#f59e0b"), ("high", "#ef4444")]:
+            fig.add_hline(y=bands[name], line=dict(color=color, width=1.5, dash="dash"),
+                          row=row, col=col)
+    fig.update_yaxes(range=[0, 1])
+    fig.update_yaxes(title_text="Risiko Diabetes", col=1)
+    return _layout(fig, theme, height=320 * nrows)
+
+
+# ===============================
+# PEMANTAUAN DRIFT
+# ===============================
+def drift_chart(labels, reference, current, theme=THEME):
+    fig = go.Figure()
+    fig.add_bar(x=labels, y=reference, name="Data Latih", marker_color=theme["primary"], opacity=0.8)
+    fig.add_bar(x=labels, y=current, name="Pasien Diskor", marker_color=theme["secondary"], opacity=0.8)
+    return _layout(fig, theme, barmode="group", yaxis_title="Proporsi", yaxis_tickformat=".0%")
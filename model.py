@@ -1,68 +1,684 @@
+import argparse
+import json
+import pickle
+import time
 import pandas as pd
 import numpy as np
 import joblib
+from datetime import datetime, timezone
+from joblib import Parallel, delayed
+
+from sklearn.base import clone
+from sklearn.model_selection import (
+    train_test_split, StratifiedKFold, RepeatedStratifiedKFold,
+    GridSearchCV, cross_validate, cross_val_predict
+)
+from sklearn.metrics import (
+    accuracy_score, precision_score, recall_score, f1_score, roc_auc_score,
+    average_precision_score, confusion_matrix, classification_report,
+    roc_curve, precision_recall_curve
+)
+from sklearn.calibration import calibration_curve
+import statsmodels.api as sm
+
+from scoring import FEATURES, export_linear_model
+from preprocessing import (
+    MODEL_BUILDERS, ZeroMedianImputer, CalibratedModel, build_pipeline, build_streaming_pipeline,
+    linear_coefficients, fit_calibration, proba_to_logit, decision_values, unwrap
+)
+from streaming import HOLDOUT_EVERY, iter_chunks, holdout_mask, scan
+from datastore import load_frame, ensure_cache, source_signature
+from aggregates import lttb
+from drift import reference_histograms
+import registry
+
+DATA_PATH = "diabetes.csv"
+MODEL_PATH = "logistic_model.pkl"
+METRICS_PATH = "metrics.pkl"
+JSON_PATH = "logistic_model.json"
+SEARCH_PATH = "search_results.pkl"
+COMPARISON_PATH = "comparison.json"
+# Porsi data uji pada split mode batch
+TEST_SIZE = 0.3
+
+CV_SCORING = ["accuracy", "precision", "recall", "f1", "roc_auc"]
+# Anggaran titik kurva ROC/PR yang disimpan (LTTB), terlepas dari ukuran data
+CURVE_POINTS = 200
+
+# Pemilihan ambang risiko: biaya false negative vs false positive (skrining),
+# dan presisi minimum untuk kategori TINGGI
+COST_FN = 5.0
+COST_FP = 1.0
+MIN_PRECISION_HIGH = 0.7
+
+# Grid regularisasi, solver, dan bobot kelas untuk mode --search
+PARAM_GRID = {
+    "model__C": [0.001, 0.01, 0.1, 1.0, 10.0, 100.0],
+    "model__solver": ["lbfgs", "liblinear", "newton-cg"],
+    "model__class_weight": [None, "balanced"]
+}
 
-from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LogisticRegression
-from sklearn.metrics import accuracy_score, roc_auc_score
 
 # ===============================
 # LOAD DATA (WAJIB sep=";")
 # ===============================
-data = pd.read_csv("diabetes.csv", sep=";")
+def load_data(path=DATA_PATH):
+    """Return (X, y); zeros in Glucose/BMI are imputed inside the pipeline
+
+    Reads the columnar cache (datastore.py), which parses the CSV only when
+    it has changed since the last run.
+    """
+    data = load_frame(path, FEATURES + ["Outcome"])
+    return data[FEATURES], data["Outcome"]
+
 
 # ===============================
-# PREPROCESSING
+# HYPERPARAMETER SEARCH (PARALEL)
 # ===============================
-cols_zero = ["Glucose", "BloodPressure", "SkinThickness", "Insulin", "BMI"]
+def search_hyperparameters(X_train, y_train, folds=5, repeats=1, n_jobs=-1):
+    """Grid search over PARAM_GRID with (repeated) stratified k-fold CV
+
+    Every (parameter set, fold) fit runs in joblib's process pool, so
+    n_jobs=-1 uses all cores.
+    """
+    if repeats > 1:
+        cv = RepeatedStratifiedKFold(n_splits=folds, n_repeats=repeats, random_state=42)
+    else:
+        cv = StratifiedKFold(n_splits=folds, shuffle=True, random_state=42)
+
+    search = GridSearchCV(
+        build_pipeline(),
+        PARAM_GRID,
+        scoring="roc_auc",
+        cv=cv,
+        n_jobs=n_jobs,
+        refit=True
+    )
+    search.fit(X_train, y_train)
+
+    n_splits = cv.get_n_splits()
+    best = search.best_index_
+    results = {
+        "best_params": search.best_params_,
+        "best_score": search.best_score_,
+        "best_fold_scores": np.array([
+            search.cv_results_[f"split{i}_test_score"][best] for i in range(n_splits)
+        ]),
+        "folds": folds,
+        "repeats": repeats,
+        "cv_results": pd.DataFrame(search.cv_results_)
+    }
+    return search.best_estimator_, results
 
-for col in cols_zero:
-    data[col] = data[col].replace(0, np.nan)
-    data[col] = data[col].fillna(data[col].median())
 
 # ===============================
-# FEATURE SELECTION
+# EVALUATION
 # ===============================
-X = data[
-    ["Glucose", "BMI", "Age", "Pregnancies", "DiabetesPedigreeFunction"]
-]
+def evaluate(model, X, y, X_test, y_test, folds=5, n_jobs=None, n_train=None,
+             curve_points=CURVE_POINTS, test_fraction=None):
+    """Build the evaluation bundle shown on the "Evaluasi Model" page
+
+    (X, y) is the data used for k-fold CV: the full dataset, or a row
+    sample in streaming mode. ROC and PR curves are reduced to at most
+    `curve_points` points with LTTB. `test_fraction` is the share of the
+    data held out for testing (default: len(X_test) / len(X)).
+    """
+    y_pred = model.predict(X_test)
+    y_prob = model.predict_proba(X_test)[:, 1]
+
+    fpr, tpr, roc_thresholds = roc_curve(y_test, y_prob)
+    precision, recall, pr_thresholds = precision_recall_curve(y_test, y_prob)
+    roc_keep = lttb(fpr, tpr, curve_points)
+    pr_keep = lttb(recall, precision, curve_points)
+    prob_true, prob_pred = calibration_curve(y_test, y_prob, n_bins=10, strategy="quantile")
+
+    # K-fold cross validation dengan hyperparameter yang sama (tanpa kalibrasi)
+    cv_scores = cross_validate(
+        clone(unwrap(model)), X, y,
+        cv=StratifiedKFold(n_splits=folds, shuffle=True, random_state=42),
+        scoring=CV_SCORING,
+        n_jobs=n_jobs
+    )
+
+    return {
+        "accuracy": accuracy_score(y_test, y_pred),
+        "auc": roc_auc_score(y_test, y_prob),
+        "precision": precision_score(y_test, y_pred),
+        "recall": recall_score(y_test, y_pred),
+        "f1": f1_score(y_test, y_pred),
+        "n_train": n_train if n_train is not None else len(X) - len(X_test),
+        "n_test": len(X_test),
+        "test_fraction": test_fraction if test_fraction is not None else len(X_test) / len(X),
+        "confusion_matrix": confusion_matrix(y_test, y_pred),
+        "classification_report": classification_report(y_test, y_pred, output_dict=True),
+        "roc": {
+            "fpr": fpr[roc_keep],
+            "tpr": tpr[roc_keep],
+            "thresholds": roc_thresholds[roc_keep]
+        },
+        "pr": {
+            "precision": precision[pr_keep],
+            "recall": recall[pr_keep],
+            # Titik terakhir kurva PR (recall 0) tidak punya threshold
+            "thresholds": pr_thresholds[pr_keep[pr_keep < len(pr_thresholds)]],
+            "average_precision": average_precision_score(y_test, y_prob)
+        },
+        "calibration": {
+            "prob_true": prob_true,
+            "prob_pred": prob_pred,
+            "method": model.calibration.method if isinstance(model, CalibratedModel) else "none"
+        },
+        "cv": {
+            "n_splits": folds,
+            **{name: cv_scores[f"test_{name}"] for name in CV_SCORING}
+        }
+    }
 
-y = data["Outcome"]
 
 # ===============================
-# SPLIT DATA
+# KALIBRASI & AMBANG RISIKO
 # ===============================
-X_train, X_test, y_train, y_test = train_test_split(
-    X, y, test_size=0.3, random_state=42, stratify=y
-)
+def calibrate(pipeline, X, y, method="sigmoid", folds=5, n_jobs=None):
+    """Calibrate a fitted pipeline; return (CalibratedModel, validation probabilities)
+
+    Same scheme as CalibratedClassifierCV(ensemble=False): every row is
+    scored by a fold model that did not see it, and the Platt/isotonic map
+    is fitted on those out-of-fold decision values. The already fitted
+    pipeline is kept as is, so warm starts survive. With folds=None the
+    pipeline's own decision values are used (streaming mode, where (X, y)
+    is a reservoir sample of millions of training rows).
+    """
+    if folds is None:
+        decision = decision_values(pipeline, X)
+    else:
+        has_decision = hasattr(pipeline, "decision_function")
+        decision = cross_val_predict(
+            clone(pipeline), X, y,
+            cv=StratifiedKFold(n_splits=folds, shuffle=True, random_state=42),
+            method="decision_function" if has_decision else "predict_proba",
+            n_jobs=n_jobs
+        )
+        if not has_decision:
+            decision = proba_to_logit(decision)
+    calibration = fit_calibration(decision, y, method)
+    return CalibratedModel(pipeline, calibration), calibration(decision)
+
+
+def threshold_sweep(y_true, y_prob, cost_fn=COST_FN, cost_fp=COST_FP):
+    """Precision, recall and cost at every distinct cut-off in one sorted pass
+
+    Scores are sorted once (O(n log n)); true/false positive counts at each
+    cut-off are cumulative sums over the sorted labels. A row counts as
+    positive when its score is > threshold; thresholds sit midway between
+    consecutive distinct scores, and the last one just below the minimum. Cost is per patient:
+    (cost_fn * FN + cost_fp * FP) / n.
+    """
+    y_true = np.asarray(y_true, dtype=np.int64)
+    y_prob = np.asarray(y_prob, dtype=np.float64)
+    order = np.argsort(-y_prob, kind="stable")
+    scores, labels = y_prob[order], y_true[order]
+
+    tp = np.cumsum(labels)
+    fp = np.cumsum(1 - labels)
+    # Indeks terakhir tiap kelompok skor yang sama
+    last = np.r_[np.flatnonzero(np.diff(scores)), len(scores) - 1]
+    below = scores[last[:-1] + 1]
+
+    # Titik awal: tidak ada pasien positif; titik akhir (semua positif) tepat
+    # di bawah skor terkecil, juga bila skor itu 0 (isotonic memotong ke 0)
+    threshold = np.r_[1.0, (scores[last[:-1]] + below) / 2, np.nextafter(scores[-1], -np.inf)]
+    tp, fp = np.r_[0, tp[last]], np.r_[0, fp[last]]
+    n_pos, n_neg = tp[-1], fp[-1]
+    with np.errstate(invalid="ignore", divide="ignore"):
+        precision = np.where(tp + fp > 0, tp / (tp + fp), 1.0)
+        recall = tp / n_pos if n_pos else np.zeros_like(threshold)
+        fpr = fp / n_neg if n_neg else np.zeros_like(threshold)
+    cost = (cost_fn * (n_pos - tp) + cost_fp * fp) / len(scores)
+    return {
+        "threshold": threshold,
+        "precision": precision,
+        "recall": recall,
+        "fpr": fpr,
+        "cost": cost,
+        "cost_fn": cost_fn,
+        "cost_fp": cost_fp
+    }
+
+
+def choose_risk_bands(sweep, min_precision=MIN_PRECISION_HIGH):
+    """Pick the SEDANG and TINGGI cut-offs from a threshold sweep
+
+    SEDANG starts at the cost-minimizing threshold; TINGGI at the lowest
+    threshold above it whose precision reaches `min_precision` (or, if none
+    does, the most precise one).
+    """
+    threshold, precision, recall = sweep["threshold"], sweep["precision"], sweep["recall"]
+    medium = int(np.argmin(sweep["cost"]))
+
+    above = np.flatnonzero((threshold > threshold[medium]) & (threshold < 1.0))
+    if len(above) == 0:
+        high = medium
+    else:
+        reach = above[precision[above] >= min_precision]
+        high = reach[np.argmin(threshold[reach])] if len(reach) else above[np.argmax(precision[above])]
+
+    return {
+        "medium": float(threshold[medium]),
+        "high": float(threshold[high]),
+        "medium_precision": float(precision[medium]),
+        "medium_recall": float(recall[medium]),
+        "high_precision": float(precision[high]),
+        "high_recall": float(recall[high]),
+        "cost_fn": sweep["cost_fn"],
+        "cost_fp": sweep["cost_fp"],
+        "min_precision": min_precision
+    }
+
+
+def tune_risk_bands(model, y_valid, p_valid, cost_fn=COST_FN, cost_fp=COST_FP,
+                    min_precision=MIN_PRECISION_HIGH):
+    """Sweep validation probabilities, set model.risk_bands; return (bands, sweep)
+
+    The stored sweep is reduced to CURVE_POINTS points with LTTB.
+    """
+    sweep = threshold_sweep(y_valid, p_valid, cost_fn, cost_fp)
+    bands = choose_risk_bands(sweep, min_precision)
+    model.risk_bands = {"medium": bands["medium"], "high": bands["high"]}
+
+    keep = lttb(sweep["threshold"], sweep["cost"], CURVE_POINTS)
+    curve = {
+        key: value[keep] if isinstance(value, np.ndarray) else value
+        for key, value in sweep.items()
+    }
+    return bands, curve
+
 
 # ===============================
-# TRAIN MODEL
+# MESIN MULTI-MODEL
 # ===============================
-model = LogisticRegression(max_iter=1000)
-model.fit(X_train, y_train)
+def candidate_files(name):
+    """(model file, metrics file) of a candidate; logistic keeps the legacy names"""
+    if name == "logistic":
+        return MODEL_PATH, METRICS_PATH
+    return f"{name}_model.pkl", f"{name}_metrics.pkl"
+
+
+def train_candidate(name, X, y, X_train, y_train, X_test, y_test, args, previous=None, n_jobs=1):
+    """Fit, calibrate, tune bands and evaluate one candidate (joblib worker)
+
+    Returns (name, model, evaluation, search_results). Warm start and grid
+    search apply to the logistic candidate only.
+    """
+    start = time.perf_counter()
+    search_results = None
+    if name == "logistic" and previous is not None:
+        # lbfgs mulai dari koefisien lama sehingga butuh lebih sedikit iterasi
+        pipeline = previous
+        pipeline["model"].set_params(warm_start=True)
+        pipeline.fit(X_train, y_train)
+        print("Iterasi solver:", int(pipeline["model"].n_iter_[0]))
+    elif name == "logistic" and args.search:
+        pipeline, search_results = search_hyperparameters(
+            X_train, y_train, args.folds, args.repeats, n_jobs
+        )
+    else:
+        pipeline = MODEL_BUILDERS[name][1]()
+        pipeline.fit(X_train, y_train)
+
+    # Kalibrasi & ambang risiko dari prediksi out-of-fold data latih
+    model, p_valid = calibrate(pipeline, X_train, y_train, args.calibration, args.folds, n_jobs)
+    train_seconds = time.perf_counter() - start
+    bands, sweep = tune_risk_bands(
+        model, y_train, p_valid, args.cost_fn, args.cost_fp, args.min_precision
+    )
+
+    evaluation = evaluate(model, X, y, X_test, y_test, args.folds, n_jobs)
+    evaluation.update(risk_bands=bands, thresholds=sweep, model_name=name, train_seconds=train_seconds)
+    return name, model, evaluation, search_results
+
+
+def train_candidates(names, X, y, X_train, y_train, X_test, y_test, args, previous=None):
+    """Train every candidate in parallel, one joblib worker per model
+
+    With --search the logistic grid search runs first on all `args.jobs`
+    cores (it dwarfs the other fits); the remaining candidates then share
+    the pool.
+    """
+    results = []
+    if args.search and "logistic" in names:
+        results.append(train_candidate(
+            "logistic", X, y, X_train, y_train, X_test, y_test, args, previous, args.jobs
+        ))
+        names = [name for name in names if name != "logistic"]
+    if names:
+        outer = min(len(names), joblib.cpu_count()) if args.jobs == -1 else min(len(names), args.jobs)
+        inner = args.jobs if outer == 1 else 1
+        results += Parallel(n_jobs=outer)(
+            delayed(train_candidate)(
+                name, X, y, X_train, y_train, X_test, y_test, args,
+                previous if name == "logistic" else None, inner
+            )
+            for name in names
+        )
+    return {name: (model, evaluation, search) for name, model, evaluation, search in results}
+
+
+def serving_profile(model, X_sample, repeat=5):
+    """Median predict_proba latency per 1k rows (ms) and pickled size (bytes)"""
+    rows = X_sample.sample(1000, replace=True, random_state=42)
+    model.predict_proba(rows)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        model.predict_proba(rows)
+        times.append(time.perf_counter() - start)
+    return {
+        "latency_ms_per_1k": float(np.median(times) * 1000),
+        "size_bytes": len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))
+    }
+
+
+def compare_candidates(trained, X_sample):
+    """Side-by-side accuracy vs serving cost of every trained candidate"""
+    models = {}
+    for name, (model, evaluation, _) in trained.items():
+        model_file, metrics_file = candidate_files(name)
+        models[name] = {
+            "label": MODEL_BUILDERS[name][0],
+            "model_file": model_file,
+            "metrics_file": metrics_file,
+            "auc": float(evaluation["auc"]),
+            "cv_auc": float(evaluation["cv"]["roc_auc"].mean()),
+            "accuracy": float(evaluation["accuracy"]),
+            "f1": float(evaluation["f1"]),
+            "train_seconds": float(evaluation["train_seconds"]),
+            **serving_profile(model, X_sample)
+        }
+        evaluation["serving"] = models[name]
+    return {"models": models}
+
 
 # ===============================
-# EVALUATION
+# STATISTIK INFERENSIAL (STATSMODELS)
 # ===============================
-y_pred = model.predict(X_test)
-y_prob = model.predict_proba(X_test)[:, 1]
+def fit_statistics(model, X_train, y_train):
+    """Fit the equivalent unpenalized Logit on the imputed training fold
+
+    Returns standard errors, odds ratios, 95% confidence intervals and
+    p-values per feature for the "Interpretasi Model" page.
+    """
+    X_imputed = unwrap(model)["impute"].transform(X_train).astype(float)
+    result = sm.Logit(y_train.astype(float), sm.add_constant(X_imputed)).fit(disp=0)
+    conf_int = result.conf_int(alpha=0.05)
+
+    rows = []
+    for name in ["const"] + list(X_train.columns):
+        rows.append({
+            "feature": name,
+            "coef": float(result.params[name]),
+            "std_err": float(result.bse[name]),
+            "odds_ratio": float(np.exp(result.params[name])),
+            "ci_low": float(np.exp(conf_int.loc[name, 0])),
+            "ci_high": float(np.exp(conf_int.loc[name, 1])),
+            "p_value": float(result.pvalues[name])
+        })
+    return {
+        "method": "statsmodels Logit (MLE, tanpa regularisasi)",
+        "n_obs": int(result.nobs),
+        "pseudo_r2": float(result.prsquared),
+        "intercept": rows[0],
+        "features": rows[1:]
+    }
+
+
+def training_baseline(model, X_train):
+    """Mean of every imputed training feature (reference patient for contributions)"""
+    X_imputed = unwrap(model)["impute"].transform(X_train).astype(float)
+    return {col: float(value) for col, value in X_imputed.mean().items()}
 
-accuracy = accuracy_score(y_test, y_pred)
-auc = roc_auc_score(y_test, y_prob)
 
 # ===============================
 # SAVE MODEL & METRICS
 # ===============================
-joblib.dump(model, "logistic_model.pkl")
+def save_artifacts(model, evaluation, statistics=None, metadata=None, keep=10,
+                   candidates=None, comparison=None, baseline=None, reference=None):
+    """Publish a new registry version and refresh the top-level logistic copies
 
-metrics = {
-    "accuracy": accuracy,
-    "auc": auc
-}
+    Every file is written to a temporary name and renamed into place, so
+    the app never reads a half-written artifact. `candidates` maps extra
+    model names to (model, evaluation). Returns the version name.
+    """
+    pipeline = unwrap(model)
+    coef, intercept = linear_coefficients(pipeline)
+    calibration = {"calibration": model.calibration.to_dict()} if isinstance(model, CalibratedModel) else {}
+    writers = {
+        MODEL_PATH: lambda path: joblib.dump(model, path),
+        METRICS_PATH: lambda path: joblib.dump(evaluation, path),
+        # Artefak ringan untuk inference NumPy (tanpa sklearn saat serving)
+        JSON_PATH: lambda path: export_linear_model(
+            path,
+            coef,
+            intercept,
+            pipeline["impute"].medians_,
+            **calibration,
+            risk_bands=getattr(model, "risk_bands", None),
+            baseline=baseline,
+            reference=reference,
+            created_at=datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            metrics={"accuracy": evaluation["accuracy"], "auc": evaluation["auc"]},
+            statistics=statistics
+        )
+    }
+    for name, (candidate, candidate_eval) in (candidates or {}).items():
+        model_file, metrics_file = candidate_files(name)
+        writers[model_file] = lambda path, m=candidate: joblib.dump(m, path)
+        writers[metrics_file] = lambda path, e=candidate_eval: joblib.dump(e, path)
+    if comparison is not None:
+        writers[COMPARISON_PATH] = lambda path: _dump_json(comparison, path)
+
+    version = registry.publish(writers, metadata)
+    registry.prune(keep)
+
+    # Salinan di root repo untuk pemakai lama (api.py, skrip lain); kandidat
+    # lain dan tabel perbandingan hanya ada di registry
+    for name in (MODEL_PATH, METRICS_PATH, JSON_PATH):
+        registry.atomic_write(name, writers[name])
+    return version
+
+
+def _dump_json(data, path):
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def load_current():
+    """Return (model, metadata) of the version CURRENT points to"""
+    metadata = registry.current_metadata() or {}
+    return joblib.load(registry.resolve(MODEL_PATH)), metadata
+
+
+# ===============================
+# TRAINING STREAMING (OUT-OF-CORE)
+# ===============================
+def train_streaming(path, chunksize=100_000, epochs=3, sample_size=100_000,
+                    previous=None, start_row=0):
+    """Fit an SGD logistic pipeline without loading the whole CSV
+
+    Pass 1 builds median sketches, scaler moments and bounded row samples;
+    pass 2 (repeated `epochs` times) feeds each chunk to partial_fit. Every
+    HOLDOUT_EVERY-th row is held out for evaluation, matching streaming.holdout_mask.
+    With `previous` (a fitted streaming pipeline) its imputer, scaler and
+    coefficients are kept and only rows from `start_row` on are trained.
+    Returns (model, train_sample, holdout_sample, n_train).
+    """
+    medians, scaler, train_sample, holdout_sample, n_rows = scan(path, chunksize, sample_size)
+    if previous is not None:
+        model = previous
+    else:
+        imputer = ZeroMedianImputer.from_medians(medians, FEATURES)
+        model = build_streaming_pipeline(imputer, scaler)
+    preprocess = model[:-1]
+    sgd = model["model"]
+
+    rng = np.random.default_rng(42)
+    for epoch in range(epochs):
+        for offset, chunk in iter_chunks(path, chunksize):
+            if offset + len(chunk) <= start_row:
+                continue
+            chunk = chunk.iloc[max(start_row - offset, 0):]
+            offset = max(offset, start_row)
+            train = chunk[~holdout_mask(offset, len(chunk))]
+            if train.empty:
+                continue
+            order = rng.permutation(len(train))
+            # Kolom cache ringkas (uint8/float32) bisa menghasilkan dtype berbeda
+            # antar chunk; partial_fit SGD menuntut float64 yang konsisten
+            X_chunk = np.asarray(preprocess.transform(train[FEATURES].iloc[order]), dtype=np.float64)
+            sgd.partial_fit(X_chunk, train["Outcome"].to_numpy()[order], classes=[0, 1])
+        print(f"Epoch {epoch + 1}/{epochs} selesai ({n_rows:,} baris)")
+
+    n_train = n_rows - int(holdout_mask(0, n_rows).sum())
+    return model, train_sample, holdout_sample, n_train
+
+
+def report(evaluation, folds, version):
+    cv_auc = evaluation["cv"]["roc_auc"]
+    print(f"Model berhasil disimpan ({registry.REGISTRY_DIR}/{version})")
+    print("Accuracy:", round(evaluation["accuracy"], 3))
+    print("AUC:", round(evaluation["auc"], 3))
+    print("CV AUC (%d-fold): %.3f ± %.3f" % (folds, cv_auc.mean(), cv_auc.std()))
+    bands = evaluation.get("risk_bands")
+    if bands:
+        print("Ambang risiko: SEDANG > %.3f, TINGGI > %.3f (kalibrasi %s)" % (
+            bands["medium"], bands["high"], evaluation["calibration"]["method"]
+        ))
+
+
+def report_comparison(comparison):
+    print("\nPerbandingan model:")
+    print("%-20s %7s %7s %9s %12s %10s" % ("Model", "AUC", "CV AUC", "Latih (s)", "ms/1k baris", "Ukuran KB"))
+    for row in comparison["models"].values():
+        print("%-20s %7.3f %7.3f %9.2f %12.2f %10.1f" % (
+            row["label"], row["auc"], row["cv_auc"], row["train_seconds"],
+            row["latency_ms_per_1k"], row["size_bytes"] / 1024
+        ))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Latih model regresi logistik risiko diabetes")
+    parser.add_argument("--data", default=DATA_PATH, help="CSV sumber (sep=';')")
+    parser.add_argument("--search", action="store_true",
+                        help="Grid search C/solver/class_weight dengan CV paralel")
+    parser.add_argument("--folds", type=int, default=5, help="Jumlah fold stratified k-fold")
+    parser.add_argument("--repeats", type=int, default=1, help="Ulangan k-fold (mode --search)")
+    parser.add_argument("--jobs", type=int, default=-1, help="Jumlah proses paralel (-1 = semua core)")
+    parser.add_argument("--stream", action="store_true",
+                        help="Training out-of-core per chunk (SGD log loss + partial_fit)")
+    parser.add_argument("--chunksize", type=int, default=100_000, help="Baris per chunk (mode --stream)")
+    parser.add_argument("--epochs", type=int, default=3, help="Jumlah lintasan data (mode --stream)")
+    parser.add_argument("--sample-size", type=int, default=100_000,
+                        help="Ukuran sampel reservoir untuk evaluasi & statistik (mode --stream)")
+    parser.add_argument("--warm-start", action="store_true",
+                        help="Lanjutkan dari koefisien versi CURRENT di registry")
+    parser.add_argument("--keep", type=int, default=10, help="Jumlah versi model yang disimpan")
+    parser.add_argument("--calibration", choices=["sigmoid", "isotonic"], default="sigmoid",
+                        help="Kalibrasi probabilitas: Platt (sigmoid) atau isotonic")
+    parser.add_argument("--cost-fn", type=float, default=COST_FN,
+                        help="Biaya satu false negative saat memilih ambang SEDANG")
+    parser.add_argument("--cost-fp", type=float, default=COST_FP,
+                        help="Biaya satu false positive saat memilih ambang SEDANG")
+    parser.add_argument("--min-precision", type=float, default=MIN_PRECISION_HIGH,
+                        help="Presisi minimum untuk kategori TINGGI")
+    parser.add_argument("--models", nargs="+", choices=list(MODEL_BUILDERS), default=["logistic"],
+                        help="Kandidat model yang dilatih paralel dan dibandingkan, mis. "
+                             "--models logistic random_forest (default hanya regresi logistik; "
+                             "regresi logistik selalu ikut)")
+    args = parser.parse_args(argv)
+    band_options = dict(cost_fn=args.cost_fn, cost_fp=args.cost_fp, min_precision=args.min_precision)
+
+    n_rows = ensure_cache(args.data)["n_rows"]
+    metadata = {
+        "mode": "stream" if args.stream else "search" if args.search else "batch",
+        "warm_start": args.warm_start,
+        "n_rows": n_rows,
+        "source": {"path": args.data, **source_signature(args.data)}
+    }
+
+    previous, start_row = None, 0
+    if args.warm_start:
+        previous, previous_meta = load_current()
+        previous = unwrap(previous)
+        start_row = previous_meta.get("n_rows", 0) if previous_meta.get("source", {}).get("path") == args.data else 0
+        if start_row >= n_rows:
+            print(f"Tidak ada baris baru sejak {previous_meta.get('version')}; model tidak diubah")
+            return
+        expected = "scale" in previous.named_steps if args.stream else "scale" not in previous.named_steps
+        if not expected:
+            parser.error("--warm-start harus memakai mode yang sama dengan model CURRENT (--stream atau tidak)")
+        print(f"Warm start dari {previous_meta.get('version', MODEL_PATH)} ({n_rows - start_row:,} baris baru)")
+
+    if args.stream:
+        start = time.perf_counter()
+        pipeline, train_sample, holdout_sample, n_train = train_streaming(
+            args.data, args.chunksize, args.epochs, args.sample_size,
+            previous=previous, start_row=start_row
+        )
+        X_sample, y_sample = train_sample[FEATURES], train_sample["Outcome"].astype(int)
+        X_test, y_test = holdout_sample[FEATURES], holdout_sample["Outcome"].astype(int)
+        model, p_valid = calibrate(pipeline, X_sample, y_sample, args.calibration)
+        train_seconds = time.perf_counter() - start
+        bands, sweep = tune_risk_bands(model, y_sample, p_valid, **band_options)
+        evaluation = evaluate(
+            model, X_sample, y_sample, X_test, y_test, args.folds, args.jobs, n_train,
+            test_fraction=1 / HOLDOUT_EVERY
+        )
+        evaluation.update(risk_bands=bands, thresholds=sweep, model_name="logistic",
+                          train_seconds=train_seconds)
+        # Versi streaming hanya berisi regresi logistik; tabel perbandingannya juga
+        comparison = compare_candidates({"logistic": (model, evaluation, None)}, X_test)
+        statistics = fit_statistics(model, X_sample, y_sample)
+        statistics["method"] += f", sampel reservoir {len(X_sample):,} baris"
+        version = save_artifacts(
+            model, evaluation, statistics, metadata, args.keep, comparison=comparison,
+            baseline=training_baseline(model, X_sample),
+            reference=reference_histograms(X_sample)
+        )
+        report(evaluation, args.folds, version)
+        return
+
+    X, y = load_data(args.data)
+
+    # ===============================
+    # SPLIT DATA
+    # ===============================
+    X_train, X_test, y_train, y_test = train_test_split(
+        X, y, test_size=TEST_SIZE, random_state=42, stratify=y
+    )
+
+    # ===============================
+    # TRAIN KANDIDAT MODEL (PARALEL) + KALIBRASI & AMBANG RISIKO
+    # ===============================
+    # Regresi logistik selalu dilatih: artefak JSON, statistik & API bergantung padanya
+    names = ["logistic"] + [name for name in args.models if name != "logistic"]
+    trained = train_candidates(names, X, y, X_train, y_train, X_test, y_test, args, previous)
+    comparison = compare_candidates(trained, X_test)
+
+    model, evaluation, results = trained.pop("logistic")
+    if results is not None:
+        joblib.dump(results, SEARCH_PATH)
+        print("Parameter terbaik:", results["best_params"])
+        print("CV AUC per fold:", np.round(results["best_fold_scores"], 3))
+    statistics = fit_statistics(model, X_train, y_train)
+    candidates = {name: (m, e) for name, (m, e, _) in trained.items()}
+    version = save_artifacts(
+        model, evaluation, statistics, metadata, args.keep, candidates, comparison,
+        baseline=training_baseline(model, X_train),
+        reference=reference_histograms(X_train)
+    )
+
+    report(evaluation, args.folds, version)
+    report_comparison(comparison)
 
-joblib.dump(metrics, "metrics.pkl")
 
-print("Model berhasil disimpan")
-print("Accuracy:", round(accuracy, 3))
-print("AUC:", round(auc, 3))
+if __name__ == "__main__":
+    main()
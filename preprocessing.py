@@ -0,0 +1,168 @@
+import numpy as np
+import pandas as pd
+
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.ensemble import HistGradientBoostingClassifier, RandomForestClassifier
+from sklearn.isotonic import IsotonicRegression
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.utils.validation import check_is_fitted
+
+from scoring import COLS_ZERO, DEFAULT_BANDS, Calibration, zero_medians, impute_zeros
+
+
+# ===============================
+# IMPUTASI NOL -> MEDIAN (DI-FIT PADA DATA LATIH)
+# ===============================
+class ZeroMedianImputer(TransformerMixin, BaseEstimator):
+    """Replace zeros in `columns` with medians learned during fit"""
+
+    def __init__(self, columns=COLS_ZERO):
+        self.columns = columns
+
+    @classmethod
+    def from_medians(cls, medians, features):
+        """Build an already-fitted imputer (e.g. from streaming sketches)"""
+        imputer = cls(columns=list(medians))
+        imputer.feature_names_in_ = np.asarray(features, dtype=object)
+        imputer.n_features_in_ = len(features)
+        imputer.medians_ = dict(medians)
+        return imputer
+
+    def fit(self, X, y=None):
+        X = self._as_frame(X, reset=True)
+        self.medians_ = zero_medians(X, [col for col in self.columns if col in X])
+        return self
+
+    def transform(self, X):
+        check_is_fitted(self, "medians_")
+        return impute_zeros(self._as_frame(X), self.medians_)
+
+    def get_feature_names_out(self, input_features=None):
+        return np.asarray(self.feature_names_in_, dtype=object)
+
+    def _as_frame(self, X, reset=False):
+        if reset:
+            if not isinstance(X, pd.DataFrame):
+                raise TypeError("ZeroMedianImputer harus di-fit dengan DataFrame")
+            self.feature_names_in_ = np.asarray(X.columns, dtype=object)
+            self.n_features_in_ = X.shape[1]
+            return X
+        if isinstance(X, pd.DataFrame):
+            return X[list(self.feature_names_in_)]
+        return pd.DataFrame(np.asarray(X), columns=self.feature_names_in_)
+
+
+def build_pipeline(**model_params):
+    """Imputation + logistic regression as one serializable estimator"""
+    params = {"max_iter": 1000, **model_params}
+    return Pipeline([
+        ("impute", ZeroMedianImputer()),
+        ("model", LogisticRegression(**params))
+    ])
+
+
+def build_gradient_boosting(**model_params):
+    """Imputation + histogram gradient boosting (scales to millions of rows)"""
+    params = {"max_iter": 200, "learning_rate": 0.05, "early_stopping": True, "random_state": 42, **model_params}
+    return Pipeline([
+        ("impute", ZeroMedianImputer()),
+        ("model", HistGradientBoostingClassifier(**params))
+    ])
+
+
+def build_random_forest(**model_params):
+    """Imputation + random forest with leaf size capped to bound model size"""
+    params = {"n_estimators": 200, "min_samples_leaf": 5, "random_state": 42, **model_params}
+    return Pipeline([
+        ("impute", ZeroMedianImputer()),
+        ("model", RandomForestClassifier(**params))
+    ])
+
+
+# Mesin model: nama kandidat -> (label tampilan, builder pipeline)
+MODEL_BUILDERS = {
+    "logistic": ("Regresi Logistik", build_pipeline),
+    "gradient_boosting": ("Gradient Boosting", build_gradient_boosting),
+    "random_forest": ("Random Forest", build_random_forest)
+}
+
+
+def build_streaming_pipeline(imputer, scaler, **model_params):
+    """Pre-fitted imputation + scaling with an incrementally trained SGD logit"""
+    params = {"loss": "log_loss", "alpha": 1e-4, "random_state": 42, **model_params}
+    return Pipeline([
+        ("impute", imputer),
+        ("scale", scaler),
+        ("model", SGDClassifier(**params))
+    ])
+
+
+def linear_coefficients(pipeline):
+    """Coefficients and intercept on the raw (imputed, unscaled) features"""
+    coef = pipeline["model"].coef_[0]
+    intercept = pipeline["model"].intercept_[0]
+    if "scale" in pipeline.named_steps:
+        scaler = pipeline["scale"]
+        coef = coef / scaler.scale_
+        intercept = intercept - np.sum(coef * scaler.mean_)
+    return coef, intercept
+
+
+# ===============================
+# KALIBRASI PROBABILITAS
+# ===============================
+class CalibratedModel:
+    """A fitted pipeline whose decision function goes through a Calibration
+
+    Exposes predict / predict_proba / decision_function like a classifier
+    and carries the risk bands chosen at training time.
+    """
+
+    def __init__(self, pipeline, calibration, risk_bands=None):
+        self.pipeline = pipeline
+        self.calibration = calibration
+        self.risk_bands = dict(risk_bands or DEFAULT_BANDS)
+
+    @property
+    def classes_(self):
+        return self.pipeline.classes_
+
+    def decision_function(self, X):
+        return decision_values(self.pipeline, X)
+
+    def predict_proba(self, X):
+        p = self.calibration(self.decision_function(X))
+        return np.column_stack([1.0 - p, p])
+
+    def predict(self, X):
+        return self.classes_[(self.predict_proba(X)[:, 1] > 0.5).astype(int)]
+
+
+def decision_values(estimator, X):
+    """decision_function, or the log-odds of predict_proba for models without one"""
+    if hasattr(estimator, "decision_function"):
+        return estimator.decision_function(X)
+    return proba_to_logit(estimator.predict_proba(X))
+
+
+def proba_to_logit(proba):
+    p = np.clip(np.asarray(proba)[:, 1], 1e-6, 1 - 1e-6)
+    return np.log(p / (1 - p))
+
+
+def fit_calibration(decision, y, method="sigmoid"):
+    """Fit a Platt ("sigmoid") or isotonic map from decision values to P(y=1)"""
+    decision = np.asarray(decision, dtype=np.float64)
+    if method == "sigmoid":
+        platt = LogisticRegression(C=1e6).fit(decision.reshape(-1, 1), y)
+        return Calibration("sigmoid", a=platt.coef_[0, 0], b=platt.intercept_[0])
+    if method == "isotonic":
+        iso = IsotonicRegression(y_min=0.0, y_max=1.0, out_of_bounds="clip").fit(decision, y)
+        return Calibration("isotonic", x=iso.X_thresholds_, y=iso.y_thresholds_)
+    raise ValueError(f"Metode kalibrasi tidak dikenal: {method}")
+
+
+def unwrap(model):
+    """The inner pipeline of a CalibratedModel (or the model itself)"""
+    return model.pipeline if isinstance(model, CalibratedModel) else model
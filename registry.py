@@ -0,0 +1,157 @@
+"""Versioned model registry with atomic publishing.
+
+Layout:
+    models/
+        v0001/  logistic_model.pkl  metrics.pkl  logistic_model.json  metadata.json
+                <kandidat>_model.pkl  <kandidat>_metrics.pkl  comparison.json
+        v0002/  ...
+        CURRENT              -> "v0002"
+        SERVING              -> "logistic" (kandidat yang dipakai halaman prediksi)
+
+A version directory is fully written under a temporary name and renamed
+into place before CURRENT is switched (write-then-rename), so a reader
+never sees a half-written artifact.
+"""
+import json
+import os
+import re
+import shutil
+import tempfile
+from datetime import datetime, timezone
+
+REGISTRY_DIR = os.environ.get("DIABETES_REGISTRY", "models")
+CURRENT = "CURRENT"
+SERVING = "SERVING"
+DEFAULT_SERVING = "logistic"
+METADATA = "metadata.json"
+_VERSION = re.compile(r"^v(\d{4,})$")
+
+
+# ===============================
+# PENULISAN ATOMIK
+# ===============================
+def atomic_write(path, write):
+    """Call write(tmp_path) and rename the result onto `path`"""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".tmp-", suffix=os.path.basename(path))
+    os.close(fd)
+    try:
+        write(tmp)
+        with open(tmp, "rb") as f:
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
+
+
+def _write_text(path, text):
+    def write(tmp):
+        with open(tmp, "w") as f:
+            f.write(text)
+    atomic_write(path, write)
+
+
+# ===============================
+# VERSI
+# ===============================
+def list_versions(registry_dir=REGISTRY_DIR):
+    if not os.path.isdir(registry_dir):
+        return []
+    return sorted(
+        (name for name in os.listdir(registry_dir) if _VERSION.match(name)),
+        key=lambda name: int(_VERSION.match(name).group(1))
+    )
+
+
+def current_version(registry_dir=REGISTRY_DIR):
+    try:
+        with open(os.path.join(registry_dir, CURRENT)) as f:
+            version = f.read().strip()
+    except OSError:
+        return None
+    return version if _VERSION.match(version) else None
+
+
+def current_metadata(registry_dir=REGISTRY_DIR):
+    version = current_version(registry_dir)
+    if version is None:
+        return None
+    with open(os.path.join(registry_dir, version, METADATA)) as f:
+        return json.load(f)
+
+
+def resolve(name, registry_dir=REGISTRY_DIR):
+    """Path of artifact `name` in the current version, or `name` itself
+
+    The top-level copy is only used while no version exists; once CURRENT
+    is set, an artifact missing from that version resolves to a path that
+    does not exist instead of a stale copy from an older version.
+    """
+    version = current_version(registry_dir)
+    if version is not None:
+        return os.path.join(registry_dir, version, name)
+    return name
+
+
+def serving_model(registry_dir=REGISTRY_DIR):
+    """Name of the candidate model the prediction page should serve"""
+    try:
+        with open(os.path.join(registry_dir, SERVING)) as f:
+            return f.read().strip() or DEFAULT_SERVING
+    except OSError:
+        return DEFAULT_SERVING
+
+
+def set_serving(name, registry_dir=REGISTRY_DIR):
+    """Switch the served candidate; survives new versions (pointer by name)"""
+    os.makedirs(registry_dir, exist_ok=True)
+    _write_text(os.path.join(registry_dir, SERVING), name + "\n")
+
+
+def publish(writers, metadata=None, registry_dir=REGISTRY_DIR):
+    """Write a new version and make it current
+
+    `writers` maps artifact file names to callables taking the destination
+    path. Returns the new version name.
+    """
+    os.makedirs(registry_dir, exist_ok=True)
+    staging = tempfile.mkdtemp(dir=registry_dir, prefix=".staging-")
+    try:
+        for name, write in writers.items():
+            write(os.path.join(staging, name))
+
+        # Nomor versi dipesan lewat rename; ulangi bila bentrok dengan proses lain
+        while True:
+            versions = list_versions(registry_dir)
+            number = int(_VERSION.match(versions[-1]).group(1)) + 1 if versions else 1
+            version = f"v{number:04d}"
+            info = {
+                "version": version,
+                "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                "previous": current_version(registry_dir),
+                **(metadata or {})
+            }
+            with open(os.path.join(staging, METADATA), "w") as f:
+                json.dump(info, f, indent=2)
+            try:
+                os.rename(staging, os.path.join(registry_dir, version))
+                break
+            except OSError:
+                if not os.path.exists(os.path.join(registry_dir, version)):
+                    raise
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+
+    _write_text(os.path.join(registry_dir, CURRENT), version + "\n")
+    return version
+
+
+def prune(keep=10, registry_dir=REGISTRY_DIR):
+    """Delete old versions, never the current one"""
+    current = current_version(registry_dir)
+    for version in list_versions(registry_dir)[:-keep] if keep > 0 else []:
+        if version != current:
+            shutil.rmtree(os.path.join(registry_dir, version), ignore_errors=True)
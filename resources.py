@@ -0,0 +1,319 @@
+"""Shared, cached loaders used by the app shell and the page modules.
+
+Everything here is cached per process (st.cache_resource) or per input
+(st.cache_data) and keyed on the file signature, so publishing a new
+model version or dataset switches over on the next rerun.
+"""
+import os
+import json
+import hashlib
+
+import streamlit as st
+
+import audit
+import registry
+import instrumentation
+
+# =========================
+# MODEL & METRIK (DIMUAT SEKALI PER PROSES)
+# =========================
+MODEL_PATH = "logistic_model.pkl"
+METRICS_PATH = "metrics.pkl"
+ARTIFACT_PATH = "logistic_model.json"
+COMPARISON_PATH = "comparison.json"
+DATA_PATH = os.environ.get("DIABETES_DATA", "diabetes.csv")
+
+
+@st.cache_data(show_spinner=False)
+def _file_hash(path, mtime_ns, size):
+    """Hash file contents; only re-read when mtime or size changes"""
+    instrumentation.count("cache_misses", loader="file_hash")
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def file_signature(path):
+    """Return (mtime_ns, sha256) identifying the current version of a file"""
+    stat = os.stat(path)
+    instrumentation.count("cache_requests", loader="file_hash")
+    return stat.st_mtime_ns, _file_hash(path, stat.st_mtime_ns, stat.st_size)
+
+
+@st.cache_resource(show_spinner=False, max_entries=8)
+def _load_pickle(path, signature):
+    """Unpickle a training artifact; cached until the file signature changes"""
+    import joblib
+
+    instrumentation.count("cache_misses", loader=os.path.basename(path))
+    return joblib.load(path)
+
+
+def load_model(path=None):
+    """Return the trained model, reloading only when the pickle changes
+
+    Defaults to the served candidate of the version models/CURRENT points
+    to, so publishing a new version switches the app over on the next rerun.
+    """
+    path = path or registry.resolve(serving_candidate()[1]["model_file"])
+    instrumentation.count("cache_requests", loader=os.path.basename(path))
+    return _load_pickle(path, file_signature(path))
+
+
+def load_metrics(path=None):
+    """Return the evaluation bundle written by model.py"""
+    path = path or registry.resolve(serving_candidate()[1]["metrics_file"])
+    instrumentation.count("cache_requests", loader=os.path.basename(path))
+    return _load_pickle(path, file_signature(path))
+
+
+@st.cache_data(show_spinner=False, max_entries=4)
+def _load_json(path, signature):
+    instrumentation.count("cache_misses", loader=os.path.basename(path))
+    with open(path) as f:
+        return json.load(f)
+
+
+def load_artifact(path=None):
+    """Return the JSON model artifact (coefficients, statistics, metrics)"""
+    path = path or registry.resolve(ARTIFACT_PATH)
+    instrumentation.count("cache_requests", loader=os.path.basename(path))
+    return _load_json(path, file_signature(path))
+
+
+def load_comparison():
+    """Return the model comparison table, or None for single-model versions"""
+    path = registry.resolve(COMPARISON_PATH)
+    if not os.path.exists(path):
+        return None
+    instrumentation.count("cache_requests", loader=COMPARISON_PATH)
+    return _load_json(path, file_signature(path))
+
+
+def serving_candidate():
+    """(name, comparison entry) of the model the prediction page serves"""
+    comparison = load_comparison()
+    models = comparison["models"] if comparison else {}
+    name = registry.serving_model()
+    # Hanya kandidat yang berkasnya ada di versi CURRENT (mode --stream hanya
+    # melatih regresi logistik), selain itu kembali ke regresi logistik
+    if name not in models or not os.path.exists(registry.resolve(models[name]["model_file"])):
+        name = registry.DEFAULT_SERVING
+    return name, models.get(name, {
+        "label": "Regresi Logistik", "model_file": MODEL_PATH, "metrics_file": METRICS_PATH
+    })
+
+# =========================
+# MEMO PREDIKSI (DIBAGI ANTAR SESI)
+# =========================
+RISK_STYLES = {
+    "TINGGI": ("#ef4444", "🚨 TINGGI", "Segera konsultasi dengan dokter untuk pemeriksaan lebih lanjut."),
+    "SEDANG": ("#f59e0b", "⚠️ SEDANG", "Perlu pemantauan rutin dan perubahan pola hidup."),
+    "RENDAH": ("#10b981", "✅ RENDAH", "Pertahankan pola hidup sehat.")
+}
+
+
+def quantize_patient(glucose, bmi, age, pregnancies, pedigree):
+    """Snap inputs to the slider steps so equal profiles share a cache key"""
+    return (
+        int(round(glucose)),
+        round(float(bmi), 1),
+        int(round(age)),
+        int(round(pregnancies)),
+        round(float(pedigree), 2)
+    )
+
+
+def _patient_frame(patient):
+    import pandas as pd
+    from scoring import FEATURES
+
+    return pd.DataFrame([patient], columns=FEATURES)
+
+
+@st.cache_data(show_spinner=False, max_entries=2048, ttl=6 * 3600)
+def _predict_patient(model_path, model_signature, patient):
+    """Score one quantized profile and pre-render its result card"""
+    from scoring import DEFAULT_BANDS, risk_level
+
+    instrumentation.count("cache_misses", loader="predict_patient")
+    model = _load_pickle(model_path, model_signature)
+    risk_score = float(model.predict_proba(_patient_frame(patient))[0, 1])
+    bands = getattr(model, "risk_bands", None) or DEFAULT_BANDS
+    level = risk_level(risk_score, bands)
+    color, label, recommendation = RISK_STYLES[level]
+    card_html = f"""
+    <div style="background: {color}20; padding: 20px; border-radius: 15px; border-left: 5px solid {color};">
+        <h3 style="color: {color}; margin: 0;">{label}</h3>
+        <p style="font-size: 2rem; font-weight: bold; margin: 10px 0;">{risk_score*100:.1f}%</p>
+        <p>Skor Risiko Diabetes</p>
+    </div>
+    """
+    return {
+        "risk_score": risk_score,
+        "risk_level": level,
+        "recommendation": recommendation,
+        "bands": bands,
+        "card_html": card_html
+    }
+
+
+def predict_patient(glucose, bmi, age, pregnancies, pedigree):
+    """Memoized single prediction keyed on model version + quantized inputs"""
+    name, candidate = serving_candidate()
+    path = registry.resolve(candidate["model_file"])
+    patient = quantize_patient(glucose, bmi, age, pregnancies, pedigree)
+    instrumentation.count("cache_requests", loader="predict_patient")
+    result = {**_predict_patient(path, file_signature(path), patient), "model_label": candidate["label"]}
+    
+    # Setiap permintaan (termasuk yang terjawab dari cache) masuk ke monitor drift
+    monitor = drift_monitor()
+    if monitor is not None:
+        monitor.update([patient])
+    
+    explainer = load_explainer(name)
+    if explainer is not None:
+        # Kontribusi log-odds per fitur terhadap pasien rata-rata data latih
+        from scoring import FEATURES, FEATURE_LABELS
+        
+        contributions = explainer.contributions([patient])[0]
+        order = sorted(range(len(FEATURES)), key=lambda j: -abs(contributions[j]))
+        result["contributions"] = [(FEATURE_LABELS[FEATURES[j]], float(contributions[j])) for j in order]
+        result["contribution_scale"] = explainer.contribution_scale
+    return result
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_scorer(path, signature):
+    """NumPy scorer built from the JSON artifact"""
+    from scoring import LinearScorer
+
+    instrumentation.count("cache_misses", loader="scorer")
+    return LinearScorer.from_json(path)
+
+
+def load_explainer(served=None):
+    """LinearScorer used for per-feature contributions, or None
+
+    Contributions are exact only for the logistic model, so other served
+    candidates (and artifacts without a training baseline) get None.
+    """
+    if (served or serving_candidate()[0]) != "logistic":
+        return None
+    path = registry.resolve(ARTIFACT_PATH)
+    instrumentation.count("cache_requests", loader="scorer")
+    scorer = _load_scorer(path, file_signature(path))
+    return scorer if scorer.baseline is not None else None
+
+
+@st.cache_data(show_spinner=False, max_entries=512, ttl=6 * 3600)
+def _what_if(model_path, model_signature, patient, ranges):
+    """Risk curves over every slider range for one profile (one batched call)"""
+    from scoring import FEATURES, FEATURE_LABELS, what_if_curves
+
+    instrumentation.count("cache_misses", loader="what_if")
+    model = _load_pickle(model_path, model_signature)
+    curves = what_if_curves(model, patient, ranges)
+    risk_now = float(model.predict_proba(_patient_frame(patient))[0, 1])
+    return {
+        FEATURE_LABELS[col]: {
+            "grid": grid.tolist(),
+            "risk": risk.tolist(),
+            "current": patient[FEATURES.index(col)],
+            "current_risk": risk_now
+        }
+        for col, (grid, risk) in curves.items()
+    }
+
+
+def what_if(glucose, bmi, age, pregnancies, pedigree, ranges):
+    """What-if curves for the served model, cached per quantized input vector
+
+    `ranges` maps each model feature to its (low, high) slider range.
+    """
+    path = registry.resolve(serving_candidate()[1]["model_file"])
+    patient = quantize_patient(glucose, bmi, age, pregnancies, pedigree)
+    instrumentation.count("cache_requests", loader="what_if")
+    return _what_if(path, file_signature(path), patient, ranges)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _drift_monitor(path, signature):
+    from drift import DriftMonitor
+
+    instrumentation.count("cache_misses", loader="drift_monitor")
+    return DriftMonitor.from_artifact(path)
+
+
+def drift_monitor():
+    """Process-wide DriftMonitor for the current model version, or None
+
+    A new model version brings new reference histograms and therefore a
+    fresh monitor; counts are kept in memory only (fixed size per feature).
+    """
+    path = registry.resolve(ARTIFACT_PATH)
+    instrumentation.count("cache_requests", loader="drift_monitor")
+    return _drift_monitor(path, file_signature(path))
+
+
+@st.cache_resource(show_spinner=False)
+def audit_log():
+    """Process-wide audit writer (one background thread shared by all sessions)"""
+    return audit.open_log()
+
+# =========================
+# AGREGAT DATASET (DIHITUNG SEKALI PER VERSI FILE)
+# =========================
+@st.cache_data(show_spinner="Menghitung agregat dataset...")
+def _dashboard_aggregates(path, signature):
+    """Histogram counts, box-plot quantiles, class counts and stats"""
+    from aggregates import load_dashboard_data, compute_aggregates
+
+    instrumentation.count("cache_misses", loader="dashboard_aggregates")
+    return compute_aggregates(load_dashboard_data(path))
+
+
+def load_aggregates(path=DATA_PATH):
+    """Return dashboard aggregates, recomputed only when the data file changes"""
+    instrumentation.count("cache_requests", loader="dashboard_aggregates")
+    return _dashboard_aggregates(path, file_signature(path))
+
+
+@st.cache_data(show_spinner=False)
+def _dataset_summary(path, signature):
+    """Row and class counts from the Outcome column only (numpy, no pandas)"""
+    import numpy as np
+    from datastore import load_arrays
+
+    instrumentation.count("cache_misses", loader="dataset_summary")
+    counts = np.bincount(np.asarray(load_arrays(path, ["Outcome"])["Outcome"]), minlength=2)
+    return {"n_rows": int(counts.sum()), "class_counts": {0: int(counts[0]), 1: int(counts[1])}}
+
+
+def load_summary(path=DATA_PATH):
+    """Return dataset size and class balance for the overview page"""
+    instrumentation.count("cache_requests", loader="dataset_summary")
+    return _dataset_summary(path, file_signature(path))
+
+
+def show_chart(name, *data):
+    """Display chart `name` as Plotly when enabled and available, else as a PNG
+
+    Both engines cache per distinct input, and each display is timed.
+    """
+    if st.session_state.get("interactive_charts", True):
+        import interactive
+
+        draw = getattr(interactive, name, None)
+        if draw is not None:
+            with instrumentation.span("chart", chart=name, engine="plotly"):
+                st.plotly_chart(interactive.render(draw, *data), use_container_width=True,
+                                config={"displaylogo": False})
+            return
+
+    import charts
+
+    with instrumentation.span("chart", chart=name, engine="matplotlib"):
+        st.image(charts.render(getattr(charts, name), *data), use_container_width=True)
@@ -0,0 +1,334 @@
+import json
+import time
+
+import numpy as np
+
+# ===============================
+# KONSTANTA BERSAMA (TRAINING & SERVING)
+# ===============================
+FEATURES = ["Glucose", "BMI", "Age", "Pregnancies", "DiabetesPedigreeFunction"]
+FEATURE_LABELS = {
+    "Glucose": "Glukosa",
+    "BMI": "BMI",
+    "Age": "Usia",
+    "Pregnancies": "Kehamilan",
+    "DiabetesPedigreeFunction": "Diabetes Pedigree"
+}
+COLS_ZERO = ["Glucose", "BloodPressure", "SkinThickness", "Insulin", "BMI"]
+
+# Ambang bawaan; model terlatih membawa ambang hasil sweep sendiri (risk_bands)
+RISK_HIGH = 0.7
+RISK_MEDIUM = 0.4
+DEFAULT_BANDS = {"medium": RISK_MEDIUM, "high": RISK_HIGH}
+
+ARTIFACT_FORMAT = "diabetes-logistic"
+# v2: probabilitas dikalibrasi ("calibration") dan ambang risiko ("risk_bands");
+# "baseline" (rata-rata fitur data latih) opsional, untuk kontribusi fitur
+ARTIFACT_VERSION = 2
+TOP_DRIVERS = 3
+WHAT_IF_POINTS = 41
+
+
+# ===============================
+# PREPROCESSING
+# ===============================
+def zero_medians(data, columns=COLS_ZERO):
+    """Median of each column with zeros treated as missing values"""
+    return {col: float(data[col].replace(0, np.nan).median()) for col in columns}
+
+
+def impute_zeros(data, medians):
+    """Replace zeros with the given medians (same rule as model.py)"""
+    data = data.copy()
+    for col, median in medians.items():
+        if col in data:
+            data[col] = data[col].replace(0, np.nan).fillna(median)
+    return data
+
+
+# ===============================
+# INFERENCE NUMPY (TANPA SKLEARN)
+# ===============================
+def sigmoid(z):
+    """Overflow-free logistic function, keeps the input dtype"""
+    return 0.5 * (1.0 + np.tanh(0.5 * z))
+
+
+class Calibration:
+    """Monotone map from the decision function to a calibrated probability
+
+    "sigmoid" (Platt): p = sigmoid(a * z + b)
+    "isotonic":        p = piecewise-linear interpolation through (x, y),
+                       clipped at both ends like IsotonicRegression
+    "none":            p = sigmoid(z)
+    """
+
+    def __init__(self, method="none", a=1.0, b=0.0, x=None, y=None):
+        self.method = method
+        self.a, self.b = float(a), float(b)
+        self.x = None if x is None else np.asarray(x, dtype=np.float64)
+        self.y = None if y is None else np.asarray(y, dtype=np.float64)
+
+    def __call__(self, z):
+        if self.method == "isotonic":
+            return np.interp(z, self.x, self.y).astype(np.result_type(z, np.float32), copy=False)
+        if self.method == "sigmoid":
+            return sigmoid(self.a * z + self.b)
+        return sigmoid(z)
+
+    def to_dict(self):
+        if self.method == "isotonic":
+            return {"method": "isotonic", "x": self.x.tolist(), "y": self.y.tolist()}
+        return {"method": self.method, "a": self.a, "b": self.b}
+
+    @classmethod
+    def from_dict(cls, params):
+        return cls(**params) if params else cls()
+
+    @property
+    def log_odds_slope(self):
+        """d logit(p) / dz, or None when the map is not linear in log-odds (isotonic)"""
+        if self.method == "isotonic":
+            return None
+        return self.a if self.method == "sigmoid" else 1.0
+
+
+class LinearScorer:
+    """Logistic model scored with plain NumPy from the exported coefficients"""
+
+    def __init__(self, coef, intercept, medians, features=FEATURES, dtype=np.float64,
+                 calibration=None, risk_bands=None, baseline=None):
+        self.features = list(features)
+        self.dtype = np.dtype(dtype)
+        self.coef = np.asarray(coef, dtype=self.dtype)
+        self.intercept = self.dtype.type(intercept)
+        self.medians = dict(medians)
+        self.baseline = None if baseline is None else np.array(
+            [baseline[col] for col in self.features], dtype=self.dtype
+        )
+        self.calibration = calibration or Calibration()
+        self.risk_bands = dict(risk_bands or DEFAULT_BANDS)
+        # Posisi kolom fitur yang nilai nol/kosongnya diganti median
+        self._impute = [
+            (j, self.dtype.type(self.medians[col]))
+            for j, col in enumerate(self.features) if col in self.medians
+        ]
+
+    @classmethod
+    def from_json(cls, path, dtype=np.float64):
+        """Load an artifact written by model.py"""
+        with open(path) as f:
+            artifact = json.load(f)
+        if artifact.get("format") != ARTIFACT_FORMAT:
+            raise ValueError(f"{path} bukan artefak {ARTIFACT_FORMAT}")
+        if artifact.get("format_version", 0) > ARTIFACT_VERSION:
+            raise ValueError(
+                f"Versi artefak {artifact['format_version']} lebih baru dari "
+                f"yang didukung ({ARTIFACT_VERSION})"
+            )
+        return cls(
+            artifact["coef"], artifact["intercept"], artifact["medians"],
+            artifact["features"], dtype,
+            calibration=Calibration.from_dict(artifact.get("calibration")),
+            risk_bands=artifact.get("risk_bands"),
+            baseline=artifact.get("baseline")
+        )
+
+    def as_array(self, X):
+        """Accept a DataFrame or 2-D array and return an imputed feature matrix"""
+        if hasattr(X, "columns"):
+            X = X[self.features].to_numpy()
+        # reshape: daftar kosong menjadi (0, n_fitur), bukan (1, 0)
+        X = np.array(X, dtype=self.dtype, ndmin=2).reshape(-1, len(self.features))
+        for j, median in self._impute:
+            column = X[:, j]
+            # Sama dengan pipeline sklearn: nol dan nilai kosong (NaN) -> median
+            column[(column == 0) | np.isnan(column)] = median
+        return X
+
+    def decision_function(self, X):
+        return self.as_array(X) @ self.coef + self.intercept
+
+    def predict_proba(self, X):
+        """Same layout as sklearn: column 0 = P(tidak diabetes), 1 = P(diabetes)"""
+        p = self.calibration(self.decision_function(X))
+        return np.column_stack([1.0 - p, p])
+
+    @property
+    def contribution_scale(self):
+        """Scale of contributions(): "calibrated_log_odds" or "model_log_odds"
+
+        Platt calibration is linear in log-odds, so contributions are scaled
+        onto the calibrated probability; isotonic is not, so they stay on the
+        uncalibrated decision function.
+        """
+        return "model_log_odds" if self.calibration.log_odds_slope is None else "calibrated_log_odds"
+
+    def contributions(self, X):
+        """Log-odds contribution of every feature: slope * coef * (x - baseline)
+
+        One (n_rows, n_features) matrix operation for the whole batch; each
+        row sums to the log-odds of the shown probability minus that of the
+        baseline patient (see contribution_scale for the isotonic case).
+        """
+        if self.baseline is None:
+            raise ValueError("Artefak model tidak memuat baseline untuk kontribusi fitur")
+        slope = self.calibration.log_odds_slope
+        coef = self.coef if slope is None else self.coef * self.dtype.type(slope)
+        return (self.as_array(X) - self.baseline) * coef
+
+
+def top_drivers(contributions, k=TOP_DRIVERS):
+    """Column indices of the k largest |contribution| per row, strongest first"""
+    contributions = np.asarray(contributions)
+    k = min(k, contributions.shape[1])
+    top = np.argpartition(-np.abs(contributions), k - 1, axis=1)[:, :k]
+    order = np.argsort(-np.abs(np.take_along_axis(contributions, top, axis=1)), axis=1)
+    return np.take_along_axis(top, order, axis=1)
+
+
+def export_linear_model(path, coef, intercept, medians, features=FEATURES, **extra):
+    """Write the versioned JSON artifact consumed by LinearScorer.from_json"""
+    artifact = {
+        "format": ARTIFACT_FORMAT,
+        "format_version": ARTIFACT_VERSION,
+        "features": list(features),
+        "coef": [float(c) for c in coef],
+        "intercept": float(intercept),
+        "medians": {col: float(v) for col, v in medians.items()},
+        **extra
+    }
+    with open(path, "w") as f:
+        json.dump(artifact, f, indent=2)
+    return artifact
+
+
+# ===============================
+# ANALISIS WHAT-IF
+# ===============================
+def what_if_curves(model, patient, ranges, points=WHAT_IF_POINTS):
+    """Risk along the full range of each feature in one predict_proba call
+
+    `patient` holds one value per FEATURES column and `ranges` maps the
+    features to sweep to (low, high). Block i of the (n_swept * points,
+    n_features) matrix is the patient with the i-th swept feature replaced
+    by its grid. Returns {feature: (grid, risk)}.
+    """
+    import pandas as pd
+
+    swept = [col for col in FEATURES if col in ranges]
+    grids = []
+    for col in swept:
+        low, high = ranges[col]
+        if col in COLS_ZERO:
+            # 0 berarti "tidak diukur" (diganti median), jadi grid dimulai setelahnya
+            low = max(low, (high - low) / (points - 1))
+        grids.append(np.linspace(low, high, points))
+    grids = np.array(grids)
+
+    X = np.tile(np.asarray(patient, dtype=np.float64), (len(swept) * points, 1))
+    columns = np.repeat([FEATURES.index(col) for col in swept], points)
+    X[np.arange(len(X)), columns] = grids.ravel()
+
+    risk = model.predict_proba(pd.DataFrame(X, columns=FEATURES))[:, 1].reshape(len(swept), points)
+    return {col: (grids[i], risk[i]) for i, col in enumerate(swept)}
+
+
+# ===============================
+# LEVEL RISIKO
+# ===============================
+def risk_level(score, bands=None):
+    """Map a single probability to TINGGI / SEDANG / RENDAH
+
+    `bands` holds the "medium" and "high" cut-offs chosen at training time;
+    without it the fixed defaults are used.
+    """
+    bands = bands or DEFAULT_BANDS
+    if score > bands["high"]:
+        return "TINGGI"
+    if score > bands["medium"]:
+        return "SEDANG"
+    return "RENDAH"
+
+
+def risk_levels(scores, bands=None):
+    """Vectorized risk_level for an array of probabilities"""
+    bands = bands or DEFAULT_BANDS
+    scores = np.asarray(scores)
+    return np.select(
+        [scores > bands["high"], scores > bands["medium"]],
+        ["TINGGI", "SEDANG"],
+        default="RENDAH"
+    )
+
+
+# ===============================
+# BATCH SCORING
+# ===============================
+def score_frame(model, data, explainer=None):
+    """Score a DataFrame with one predict_proba call and attach risk columns
+
+    `model` is the fitted (calibrated) pipeline or a LinearScorer; both
+    impute zeros with the training medians themselves, and both carry the
+    risk bands chosen at training time when the artifact has them. With an
+    `explainer` (a LinearScorer with a baseline) the per-feature log-odds
+    contributions and the top drivers of every row are attached as well.
+    """
+    missing = [col for col in FEATURES if col not in data]
+    if missing:
+        raise ValueError("Kolom tidak ditemukan: " + ", ".join(missing))
+
+    scores = model.predict_proba(data[FEATURES])[:, 1]
+
+    result = data.copy()
+    result["risk_score"] = scores.round(4)
+    result["risk_level"] = risk_levels(scores, getattr(model, "risk_bands", None))
+    if explainer is not None:
+        contributions = explainer.contributions(data[FEATURES])
+        for j, col in enumerate(FEATURES):
+            result[f"contrib_{col}"] = contributions[:, j].round(4)
+        result["contrib_scale"] = explainer.contribution_scale
+        labels = np.array([FEATURE_LABELS[col] for col in FEATURES], dtype=object)
+        for rank, column in enumerate(top_drivers(contributions).T, start=1):
+            result[f"driver_{rank}"] = labels[column]
+    return result
+
+
+def score_csv(model, source, chunksize=50_000, explainer=None):
+    """Stream a ';'-separated CSV and yield scored chunks of `chunksize` rows"""
+    import pandas as pd
+
+    for chunk in pd.read_csv(source, sep=";", chunksize=chunksize):
+        yield score_frame(model, chunk, explainer)
+
+
+def score_csv_to_text(model, source, chunksize=50_000, explainer=None, monitor=None):
+    """Score a whole CSV chunk by chunk; return (csv_text, summary)
+
+    Every scored chunk is also fed to `monitor` (a drift.DriftMonitor).
+    """
+    parts = []
+    counts = {"TINGGI": 0, "SEDANG": 0, "RENDAH": 0}
+    n_rows = 0
+    preview = None
+
+    start = time.perf_counter()
+    for scored in score_csv(model, source, chunksize, explainer):
+        if preview is None:
+            preview = scored.head(20)
+        if monitor is not None:
+            monitor.update(scored)
+        parts.append(scored.to_csv(sep=";", index=False, header=n_rows == 0))
+        for level, count in scored["risk_level"].value_counts().items():
+            counts[level] += int(count)
+        n_rows += len(scored)
+    elapsed = time.perf_counter() - start
+
+    summary = {
+        "rows": n_rows,
+        "seconds": elapsed,
+        "rows_per_second": n_rows / elapsed if elapsed > 0 else 0.0,
+        "counts": counts,
+        "preview": preview
+    }
+    return "".join(parts), summary
@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import StandardScaler
+
+from scoring import FEATURES, COLS_ZERO
+from datastore import iter_frames
+
+# Setiap baris ke-HOLDOUT_EVERY disisihkan sebagai data uji (10%)
+HOLDOUT_EVERY = 10
+
+
+# ===============================
+# RESERVOIR SKETCH (MEMORI TETAP)
+# ===============================
+class ReservoirSketch:
+    """Uniform fixed-size sample of a stream (Algorithm R, chunk-vectorized)
+
+    Used as a quantile sketch for the imputation medians and as a bounded
+    row sample for statistics and evaluation on out-of-core data.
+    """
+
+    def __init__(self, size=100_000, seed=42):
+        self.size = size
+        self.seen = 0
+        self.filled = 0
+        self._rng = np.random.default_rng(seed)
+        self._items = None
+
+    def update(self, values):
+        values = np.asarray(values)
+        n = len(values)
+        if n == 0:
+            return
+        if self._items is None:
+            self._items = np.empty((self.size,) + values.shape[1:], dtype=values.dtype)
+
+        # Isi reservoir sampai penuh
+        take = min(self.size - self.filled, n)
+        self._items[self.filled:self.filled + take] = values[:take]
+        self.filled += take
+
+        # Sisa chunk: item ke-i menggantikan slot acak j < size dengan peluang size/(i+1)
+        rest = values[take:]
+        if len(rest):
+            positions = self.seen + take + np.arange(len(rest))
+            slots = self._rng.integers(0, positions + 1)
+            keep = slots < self.size
+            self._items[slots[keep]] = rest[keep]
+        self.seen += n
+
+    @property
+    def sample(self):
+        if self._items is None:
+            return np.empty((0,))
+        return self._items[:self.filled]
+
+    def quantile(self, q):
+        return float(np.quantile(self.sample, q)) if self.filled else float("nan")
+
+    def median(self):
+        return self.quantile(0.5)
+
+
+# ===============================
+# BACA DATA PER CHUNK
+# ===============================
+def iter_chunks(path, chunksize=100_000):
+    """Yield (row_offset, chunk) with only the model columns
+
+    Chunks are sliced from the columnar cache, so the CSV text is parsed
+    once (on the first run after it changes) instead of on every pass.
+    """
+    yield from iter_frames(path, FEATURES + ["Outcome"], chunksize)
+
+
+def holdout_mask(offset, n, every=HOLDOUT_EVERY):
+    """Deterministic holdout: every `every`-th row of the file is held out"""
+    return (offset + np.arange(n)) % every == 0
+
+
+def scan(path, chunksize=100_000, sample_size=100_000, seed=42):
+    """First pass: median sketches, scaler moments and a row sample
+
+    Returns (medians, scaler, train_sample, holdout_sample, n_rows) where
+    the samples are DataFrames of at most `sample_size` rows.
+    """
+    impute_cols = [col for col in COLS_ZERO if col in FEATURES]
+    sketches = {col: ReservoirSketch(sample_size, seed) for col in impute_cols}
+    train_rows = ReservoirSketch(sample_size, seed + 1)
+    holdout_rows = ReservoirSketch(sample_size, seed + 2)
+    scaler = StandardScaler()
+    n_rows = 0
+
+    for offset, chunk in iter_chunks(path, chunksize):
+        for col in impute_cols:
+            values = chunk[col].to_numpy(dtype=np.float64)
+            sketches[col].update(values[values != 0])
+
+        # Nol = missing; StandardScaler.partial_fit mengabaikan NaN
+        features = chunk[FEATURES].astype(np.float64)
+        for col in impute_cols:
+            features[col] = features[col].replace(0, np.nan)
+
+        held = holdout_mask(offset, len(chunk))
+        scaler.partial_fit(features[~held])
+
+        rows = chunk[FEATURES + ["Outcome"]].to_numpy(dtype=np.float64)
+        train_rows.update(rows[~held])
+        holdout_rows.update(rows[held])
+        n_rows += len(chunk)
+
+    columns = FEATURES + ["Outcome"]
+    medians = {col: sketch.median() for col, sketch in sketches.items()}
+    return (
+        medians,
+        scaler,
+        pd.DataFrame(train_rows.sample, columns=columns),
+        pd.DataFrame(holdout_rows.sample, columns=columns),
+        n_rows
+    )
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from drift import MIN_ROWS, DriftMonitor, reference_histograms
+from scoring import FEATURES
+
+
+@pytest.fixture
+def reference():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(rng.normal(100, 20, (5000, len(FEATURES))), columns=FEATURES)
+    return data, reference_histograms(data)
+
+
+def test_empty_batch(reference):
+    _, histograms = reference
+    monitor = DriftMonitor(histograms)
+    monitor.update([])
+    monitor.update(pd.DataFrame(columns=FEATURES, dtype=float))
+    report = monitor.report()
+    assert report["n_rows"] == 0
+    assert all(row["psi"] == 0.0 and row["status"] == "sampel kecil" for row in report["features"].values())
+
+
+def test_nan_values_are_not_counted(reference):
+    _, histograms = reference
+    monitor = DriftMonitor(histograms)
+    rows = np.full((3, len(FEATURES)), 100.0)
+    rows[0, 0] = np.nan
+    monitor.update(rows)
+    counts = dict(zip(monitor.features, monitor.counts))
+    assert counts[FEATURES[0]].sum() == 2
+    assert counts[FEATURES[1]].sum() == 3
+    assert all(np.isfinite(row["psi"]) for row in monitor.report()["features"].values())
+
+
+def test_same_distribution_is_stable_and_shift_is_drift(reference):
+    data, histograms = reference
+    monitor = DriftMonitor(histograms)
+    monitor.update(data)
+    assert all(row["status"] == "stabil" for row in monitor.report()["features"].values())
+
+    monitor.reset()
+    shifted = data.head(MIN_ROWS * 5).copy()
+    shifted[FEATURES[0]] += 40
+    monitor.update(shifted.to_numpy())
+    features = monitor.report()["features"]
+    assert features[FEATURES[0]]["status"] == "drift"
+    assert features[FEATURES[0]]["ks"] > 0.5
+    assert features[FEATURES[1]]["status"] == "stabil"
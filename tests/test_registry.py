@@ -0,0 +1,78 @@
+import os
+
+import registry
+
+
+def write_text(text):
+    def write(path):
+        with open(path, "w") as f:
+            f.write(text)
+    return write
+
+
+def read(path):
+    with open(path) as f:
+        return f.read()
+
+
+def test_publish_switches_current(tmp_path):
+    directory = str(tmp_path)
+    assert registry.current_version(directory) is None
+
+    first = registry.publish({"a.txt": write_text("1")}, {"mode": "batch"}, directory)
+    second = registry.publish({"a.txt": write_text("2")}, registry_dir=directory)
+
+    assert (first, second) == ("v0001", "v0002")
+    assert registry.current_version(directory) == "v0002"
+    assert read(registry.resolve("a.txt", directory)) == "2"
+    metadata = registry.current_metadata(directory)
+    assert metadata["version"] == "v0002" and metadata["previous"] == "v0001"
+    assert not [name for name in os.listdir(directory) if name.startswith(".")]
+
+
+def test_resolve_does_not_fall_back_once_a_version_exists(tmp_path, monkeypatch):
+    directory = str(tmp_path / "models")
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "b.txt").write_text("root")
+
+    # Tanpa versi: salinan root dipakai
+    assert registry.resolve("b.txt", directory) == "b.txt"
+
+    registry.publish({"a.txt": write_text("1")}, registry_dir=directory)
+    path = registry.resolve("b.txt", directory)
+    assert path == os.path.join(directory, "v0001", "b.txt")
+    assert not os.path.exists(path)
+
+
+def test_failed_publish_leaves_current_untouched(tmp_path):
+    directory = str(tmp_path)
+    registry.publish({"a.txt": write_text("1")}, registry_dir=directory)
+
+    def broken(path):
+        raise RuntimeError("gagal")
+
+    try:
+        registry.publish({"a.txt": write_text("2"), "b.txt": broken}, registry_dir=directory)
+    except RuntimeError:
+        pass
+    assert registry.list_versions(directory) == ["v0001"]
+    assert registry.current_version(directory) == "v0001"
+    assert not [name for name in os.listdir(directory) if name.startswith(".")]
+
+
+def test_prune_keeps_newest_and_current(tmp_path):
+    directory = str(tmp_path)
+    for i in range(5):
+        registry.publish({"a.txt": write_text(str(i))}, registry_dir=directory)
+    # CURRENT diarahkan ke versi lama (rollback) tidak boleh terhapus
+    (tmp_path / registry.CURRENT).write_text("v0001\n")
+
+    registry.prune(keep=2, registry_dir=directory)
+    assert registry.list_versions(directory) == ["v0001", "v0004", "v0005"]
+
+
+def test_serving_pointer(tmp_path):
+    directory = str(tmp_path)
+    assert registry.serving_model(directory) == registry.DEFAULT_SERVING
+    registry.set_serving("random_forest", directory)
+    assert registry.serving_model(directory) == "random_forest"
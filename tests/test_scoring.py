@@ -0,0 +1,66 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import ROOT
+from model import calibrate
+from preprocessing import build_pipeline, linear_coefficients
+from scoring import FEATURES, LinearScorer, export_linear_model, score_frame
+
+
+@pytest.fixture(scope="module", params=["sigmoid", "isotonic"])
+def models(request, tmp_path_factory):
+    """Calibrated sklearn pipeline and the LinearScorer exported from it"""
+    data = pd.read_csv(os.path.join(ROOT, "diabetes.csv"), sep=";")
+    pipeline = build_pipeline().fit(data[FEATURES], data["Outcome"])
+    model, _ = calibrate(pipeline, data[FEATURES], data["Outcome"], request.param)
+    coef, intercept = linear_coefficients(pipeline)
+    path = tmp_path_factory.mktemp("artifact") / "logistic_model.json"
+    export_linear_model(
+        path, coef, intercept, pipeline["impute"].medians_,
+        calibration=model.calibration.to_dict(), baseline=dict(zip(FEATURES, data[FEATURES].mean()))
+    )
+    return model, LinearScorer.from_json(path), data
+
+
+def test_linear_scorer_matches_pipeline(models):
+    model, scorer, data = models
+    np.testing.assert_allclose(
+        scorer.predict_proba(data[FEATURES]), model.predict_proba(data[FEATURES]), atol=1e-9
+    )
+
+
+def test_zero_and_missing_values_are_imputed_like_the_pipeline(models):
+    model, scorer, _ = models
+    patients = pd.DataFrame(
+        [[0, 33.6, 50, 6, 0.627], [148, 0, 50, 6, 0.627], [148, np.nan, 50, 6, 0.627], [np.nan, np.nan, 21, 0, 0.2]],
+        columns=FEATURES
+    )
+    expected = model.predict_proba(patients)
+    np.testing.assert_allclose(scorer.predict_proba(patients), expected, atol=1e-9)
+    np.testing.assert_allclose(scorer.predict_proba(patients.to_numpy()), expected, atol=1e-9)
+
+    by_pipeline = score_frame(model, patients)
+    by_scorer = score_frame(scorer, patients)
+    assert by_scorer["risk_score"].tolist() == by_pipeline["risk_score"].tolist()
+    assert not by_scorer["risk_score"].isna().any()
+
+
+def test_empty_batch(models):
+    _, scorer, _ = models
+    assert scorer.predict_proba([]).shape == (0, 2)
+    assert scorer.contributions([]).shape == (0, len(FEATURES))
+
+
+def test_contributions_sum_to_shown_log_odds(models):
+    _, scorer, data = models
+    X = data[FEATURES].head(50)
+    total = scorer.contributions(X).sum(axis=1)
+    if scorer.contribution_scale == "calibrated_log_odds":
+        logit = lambda p: np.log(p / (1 - p))
+        expected = logit(scorer.predict_proba(X)[:, 1]) - logit(scorer.predict_proba(scorer.baseline)[0, 1])
+    else:
+        expected = scorer.decision_function(X) - scorer.decision_function(scorer.baseline)[0]
+    np.testing.assert_allclose(total, expected, atol=1e-9)
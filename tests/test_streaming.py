@@ -0,0 +1,21 @@
+import os
+import shutil
+
+import numpy as np
+
+from conftest import ROOT
+from model import train_streaming
+from scoring import FEATURES
+
+
+def test_multi_chunk_training_with_compact_cache_dtypes(tmp_path, monkeypatch):
+    # Cache kolom (uint8/float32) ditulis relatif ke direktori kerja
+    monkeypatch.chdir(tmp_path)
+    shutil.copy(os.path.join(ROOT, "diabetes.csv"), "diabetes.csv")
+
+    model, train_sample, holdout_sample, n_train = train_streaming(
+        "diabetes.csv", chunksize=200, epochs=1, sample_size=1000
+    )
+    assert n_train + len(holdout_sample) == 768
+    proba = model.predict_proba(holdout_sample[FEATURES])[:, 1]
+    assert np.all(np.isfinite(proba)) and np.all((proba >= 0) & (proba <= 1))
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from model import choose_risk_bands, threshold_sweep
+
+
+def brute_force(y_true, y_prob, threshold, cost_fn, cost_fp):
+    """Precision, recall and cost at one cut-off by direct counting"""
+    positive = y_prob > threshold
+    tp = int(np.sum(positive & (y_true == 1)))
+    fp = int(np.sum(positive & (y_true == 0)))
+    fn = int(np.sum(~positive & (y_true == 1)))
+    precision = tp / (tp + fp) if tp + fp else 1.0
+    recall = tp / (tp + fn) if tp + fn else 0.0
+    return precision, recall, (cost_fn * fn + cost_fp * fp) / len(y_true)
+
+
+def assert_matches_brute_force(y_true, y_prob):
+    sweep = threshold_sweep(y_true, y_prob)
+    for i, threshold in enumerate(sweep["threshold"]):
+        precision, recall, cost = brute_force(y_true, y_prob, threshold, sweep["cost_fn"], sweep["cost_fp"])
+        assert sweep["precision"][i] == pytest.approx(precision)
+        assert sweep["recall"][i] == pytest.approx(recall)
+        assert sweep["cost"][i] == pytest.approx(cost)
+    return sweep
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_sweep_matches_brute_force_with_ties_and_clipped_scores(seed):
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(2, 80))
+    y_true = rng.integers(0, 2, n)
+    # Dibulatkan agar banyak skor kembar; 0 dan 1 seperti hasil isotonic
+    y_prob = np.round(rng.random(n), 1)
+    y_prob[rng.random(n) < 0.2] = 0.0
+    y_prob[rng.random(n) < 0.1] = 1.0
+    assert_matches_brute_force(y_true, y_prob)
+
+
+def test_sweep_with_all_zero_scores():
+    y_true = np.array([0, 1, 1, 0, 1])
+    sweep = assert_matches_brute_force(y_true, np.zeros(5))
+    assert sweep["threshold"][-1] < 0.0
+    assert sweep["recall"][-1] == 1.0
+    assert sweep["cost"][-1] == pytest.approx(2 * sweep["cost_fp"] / 5)
+
+
+def test_sweep_endpoints():
+    y_true = np.array([0, 0, 1, 1])
+    sweep = assert_matches_brute_force(y_true, np.array([0.1, 0.4, 0.35, 0.8]))
+    assert sweep["recall"][0] == 0.0 and sweep["recall"][-1] == 1.0
+    assert sweep["cost"][0] == pytest.approx(2 * sweep["cost_fn"] / 4)
+    assert sweep["cost"][-1] == pytest.approx(2 * sweep["cost_fp"] / 4)
+
+
+def test_risk_bands_are_ordered_and_minimize_cost():
+    rng = np.random.default_rng(0)
+    y_true = rng.integers(0, 2, 500)
+    y_prob = np.clip(0.35 * y_true + rng.random(500) * 0.65, 0, 1)
+    sweep = threshold_sweep(y_true, y_prob)
+    bands = choose_risk_bands(sweep, min_precision=0.8)
+    assert bands["medium"] <= bands["high"]
+    assert bands["medium"] == pytest.approx(sweep["threshold"][np.argmin(sweep["cost"])])
+    assert bands["high_precision"] >= 0.8
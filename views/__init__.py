@@ -0,0 +1 @@
+"""Page modules of the Streamlit app, one per sidebar entry; each exposes render()."""
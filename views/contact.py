@@ -0,0 +1,70 @@
+"""Contact page."""
+import streamlit as st
+
+
+# =========================
+# CONTACT
+# =========================
+def render():
+    st.markdown("""
+    <div class="custom-header">
+        <h1>💌 Kontak & Informasi</h1>
+        <p>Hubungi Kami untuk Informasi Lebih Lanjut</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        st.markdown('<div class="custom-card">', unsafe_allow_html=True)
+        
+        st.markdown('<p class="custom-section">📧 Hubungi Tim Kami</p>', unsafe_allow_html=True)
+        
+        contact_form()
+        
+        # Informasi kontak
+        st.markdown('<p class="custom-section">📍 Informasi Kontak</p>', unsafe_allow_html=True)
+        
+        contact_col1, contact_col2 = st.columns(2)
+        
+        with contact_col1:
+            st.markdown("""
+            <div style="background: linear-gradient(135deg, #7b6cf6, #9370db); padding: 20px; border-radius: 15px; color: white; height: 200px;">
+                <h4>💖 Tim Analisis Data</h4>
+                <p><b>📧 Email:</b> amalianafida2@gmail.com</p>
+                <p><b>📱 Telepon:</b> +62 821 3654 8627</p>
+                <p><b>🏢 Alamat:</b> Semarang, Indonesia</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown('<div class="custom-card">', unsafe_allow_html=True)
+        
+        st.markdown('<p class="custom-section">🔗 Tautan Cepat</p>', unsafe_allow_html=True)
+        
+        st.markdown("""
+        <div style="display: flex; flex-direction: column; gap: 10px;">
+            <p>📄 Dokumentasi Teknis</p>
+            <p>📊 Dataset Pima Indians</p>
+            <p>📚 Publikasi Ilmiah</p>
+            <p>🏥 Rekomendasi Klinis</p>
+        </div>
+        """, unsafe_allow_html=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+
+@st.fragment
+def contact_form():
+    """Simple contact form; typing reruns only this fragment"""
+    name = st.text_input("Nama Lengkap")
+    email = st.text_input("Alamat Email")
+    message = st.text_area("Pesan Anda", height=150)
+    
+    if st.button("📤 Kirim Pesan", use_container_width=True):
+        if name and email and message:
+            st.success("✅ Pesan Anda telah berhasil dikirim!")
+        else:
+            st.error("⚠️ Harap isi semua field yang diperlukan.")
@@ -0,0 +1,154 @@
+"""Dashboard Utama page: distributions of the medical variables."""
+import streamlit as st
+
+from resources import drift_monitor, load_aggregates, show_chart
+
+
+# =========================
+# DASHBOARD UTAMA
+# =========================
+def render():
+    st.markdown("""
+    <div class="custom-header">
+        <h1>📊 Dashboard Utama</h1>
+        <p>Visualisasi Data dan Analisis Diabetes</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    agg = load_aggregates()
+    
+    st.markdown('<div class="custom-card">', unsafe_allow_html=True)
+    st.markdown('<p class="custom-section">📈 Distribusi Variabel Medis</p>', unsafe_allow_html=True)
+    
+    # Tab untuk berbagai visualisasi; tiap tab adalah fragment tersendiri
+    tab1, tab2, tab3 = st.tabs(["📊 Histogram", "📈 Box Plot", "🔍 Statistik"])
+    
+    with tab1:
+        histogram_tab(agg)
+    
+    with tab2:
+        box_plot_tab(agg)
+    
+    with tab3:
+        statistics_tab(agg)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+    
+    # Pemantauan drift pasien yang diskor terhadap data latih
+    st.markdown('<div class="custom-card">', unsafe_allow_html=True)
+    drift_section()
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@st.fragment
+def histogram_tab(agg):
+    """Glucose and BMI histograms from pre-aggregated bin counts"""
+    from aggregates import DASHBOARD_COLUMNS
+    
+    col1, col2 = st.columns(2)
+    
+    for col, column, xlabel in [(col1, "Glucose", "Glukosa (mg/dL)"), (col2, "BMI", "BMI")]:
+        with col:
+            # Histogram dari hitungan bin yang sudah diagregasi
+            st.markdown(f"#### Distribusi {DASHBOARD_COLUMNS[column]}")
+            show_chart("histogram_chart", agg["histograms"][column], xlabel)
+
+
+@st.fragment
+def box_plot_tab(agg):
+    """Age box plot and class proportions"""
+    from aggregates import CLASS_LABELS
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Box plot dari kuartil yang sudah diagregasi
+        st.markdown("#### Box Plot Usia")
+        show_chart("box_chart", agg["box"]["Age"], 'Usia (tahun)')
+    
+    with col2:
+        # Pie chart distribusi diabetes
+        st.markdown("#### Proporsi Kasus Diabetes")
+        diabetes_counts = agg["class_counts"]
+        show_chart(
+            "pie_chart",
+            [CLASS_LABELS[label] for label in diabetes_counts],
+            list(diabetes_counts.values())
+        )
+
+
+@st.fragment
+def statistics_tab(agg):
+    """Descriptive statistics table and insight cards"""
+    # Statistik deskriptif
+    st.markdown("#### Statistik Deskriptif")
+    st.dataframe(agg["describe"], use_container_width=True)
+    
+    # Insight cards dari rasio risiko pada dataset
+    insights = agg["insights"]
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #7b6cf6, #9370db); padding: 20px; border-radius: 15px; color: white; height: 200px;">
+            <h4>💡 Insight 1</h4>
+            <p>Pasien dengan glukosa > 140 mg/dL memiliki proporsi diabetes {insights['glucose_140']:.1f}x lebih tinggi.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #ec4899, #db7093); padding: 20px; border-radius: 15px; color: white; height: 200px;">
+            <h4>💡 Insight 2</h4>
+            <p>BMI > 30 meningkatkan proporsi diabetes sebesar {insights['bmi_30'] - 1:.0%} dibandingkan BMI ≤ 30.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div style="background: linear-gradient(135deg, #7b6cf6, #ec4899); padding: 20px; border-radius: 15px; color: white; height: 200px;">
+            <h4>💡 Insight 3</h4>
+            <p>Usia > 35 tahun berkorelasi dengan peningkatan proporsi diabetes sebesar {insights['age_35'] - 1:.0%}.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+@st.fragment
+def drift_section():
+    """PSI / binned KS of scored patients against the training histograms"""
+    import pandas as pd
+    from datetime import datetime
+    from drift import PSI_DRIFT, PSI_WARN, bin_labels
+    from scoring import FEATURE_LABELS
+    
+    st.markdown('<p class="custom-section">🛰️ Pemantauan Drift Fitur</p>', unsafe_allow_html=True)
+    st.markdown('<p class="custom-desc">Distribusi pasien yang diskor (form prediksi dan batch CSV) dibandingkan dengan histogram data latih yang disimpan saat training. Hanya hitungan per bin yang disimpan, sehingga memori tetap walau jutaan baris diskor.</p>', unsafe_allow_html=True)
+    
+    monitor = drift_monitor()
+    if monitor is None:
+        st.info("Artefak model belum memuat histogram referensi. Latih ulang dengan model.py.")
+        return
+    
+    st.button("🔄 Perbarui", key="drift_refresh")
+    report = monitor.report()
+    if not report["n_rows"]:
+        st.info("Belum ada pasien yang diskor sejak model ini dimuat.")
+        return
+    
+    features = report["features"]
+    drift_df = pd.DataFrame({
+        'Variabel': [FEATURE_LABELS[col] for col in features],
+        'PSI': [row["psi"] for row in features.values()],
+        'KS': [row["ks"] for row in features.values()],
+        'Status': [row["status"] for row in features.values()]
+    }).round({'PSI': 3, 'KS': 3})
+    st.dataframe(drift_df, use_container_width=True, hide_index=True)
+    st.caption(
+        f"{report['n_rows']:,} baris dipantau sejak {datetime.fromtimestamp(report['since']):%d-%m-%Y %H:%M}. "
+        f"PSI < {PSI_WARN:g} stabil, < {PSI_DRIFT:g} waspada, selain itu drift; KS = selisih CDF terbesar antar bin."
+    )
+    
+    column = st.selectbox("Distribusi variabel", list(features),
+                          format_func=lambda col: FEATURE_LABELS[col], key="drift_feature")
+    row = features[column]
+    show_chart("drift_chart", bin_labels(row["cuts"]), row["reference"], row["current"])
@@ -0,0 +1,160 @@
+"""Evaluasi Model page: metrics, curves, calibration and model comparison."""
+import streamlit as st
+
+import registry
+from resources import load_comparison, load_metrics, serving_candidate, show_chart
+
+
+# =========================
+# EVALUASI MODEL
+# =========================
+def render():
+    st.markdown("""
+    <div class="custom-header">
+        <h1>📈 Evaluasi Model</h1>
+        <p>Analisis Performa Model Prediksi</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="custom-card">', unsafe_allow_html=True)
+    
+    model_evaluation()
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@st.fragment
+def model_evaluation():
+    """Comparison table, model picker and the picked model's evaluation
+
+    Runs as a fragment: switching the inspected model reruns only this
+    section, not the CSS, sidebar and footer of the app.
+    """
+    import numpy as np
+    import pandas as pd
+    
+    served, candidate = serving_candidate()
+    comparison = load_comparison()
+    
+    # Perbandingan kandidat model (akurasi vs biaya serving)
+    if comparison:
+        models = comparison["models"]
+        st.markdown('<p class="custom-section">⚖️ Perbandingan Model</p>', unsafe_allow_html=True)
+        st.markdown('<p class="custom-desc">Semua kandidat dilatih paralel pada split data yang sama. Latensi adalah median waktu <code>predict_proba</code> untuk 1.000 baris; ukuran adalah model ter-pickle.</p>', unsafe_allow_html=True)
+        
+        comparison_df = pd.DataFrame({
+            'Model': [row["label"] for row in models.values()],
+            'AUC': [row["auc"] for row in models.values()],
+            'CV AUC': [row["cv_auc"] for row in models.values()],
+            'Akurasi': [row["accuracy"] for row in models.values()],
+            'F1-Score': [row["f1"] for row in models.values()],
+            'Waktu Latih (s)': [row["train_seconds"] for row in models.values()],
+            'Latensi (ms/1k baris)': [row["latency_ms_per_1k"] for row in models.values()],
+            'Ukuran (KB)': [row["size_bytes"] / 1024 for row in models.values()],
+            'Dipakai': ["✅" if name == served else "" for name in models]
+        }).round(3)
+        st.dataframe(comparison_df, use_container_width=True, hide_index=True)
+        
+        names = list(models)
+        selected = st.selectbox(
+            "Tampilkan evaluasi model", names, index=names.index(served),
+            format_func=lambda name: models[name]["label"], key="evaluated_model"
+        )
+        if selected != served:
+            if st.button(f"✅ Gunakan {models[selected]['label']} untuk Prediksi", use_container_width=True):
+                registry.set_serving(selected)
+                st.rerun(scope="app")
+        candidate = models[selected]
+    
+    ev = load_metrics(registry.resolve(candidate["metrics_file"]))
+    cv = ev["cv"]
+    
+    st.markdown('<p class="custom-section">📊 Metrik Evaluasi Model</p>', unsafe_allow_html=True)
+    st.markdown(f'<p class="custom-desc">Berikut adalah metrik evaluasi model {candidate["label"]} pada data uji ({ev["n_test"]:,} pasien, {ev.get("test_fraction", 0.3):.0%} data). Angka di bawah setiap metrik adalah rata-rata {cv["n_splits"]}-fold cross validation.</p>', unsafe_allow_html=True)
+    
+    # Metrik evaluasi dalam cards
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("🎯 Akurasi", f"{ev['accuracy']:.1%}", f"CV {cv['accuracy'].mean():.1%}", delta_color="off")
+    with col2:
+        st.metric("🎯 Presisi", f"{ev['precision']:.1%}", f"CV {cv['precision'].mean():.1%}", delta_color="off")
+    with col3:
+        st.metric("🎯 Recall", f"{ev['recall']:.1%}", f"CV {cv['recall'].mean():.1%}", delta_color="off")
+    with col4:
+        st.metric("🎯 F1-Score", f"{ev['f1']:.1%}", f"CV {cv['f1'].mean():.1%}", delta_color="off")
+    
+    # Confusion Matrix
+    st.markdown('<p class="custom-section" style="margin-top: 30px;">📊 Confusion Matrix</p>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Confusion Matrix")
+        
+        show_chart("confusion_matrix_chart", ev["confusion_matrix"])
+    
+    with col2:
+        # Classification Report
+        st.markdown("#### Classification Report")
+        
+        report = ev["classification_report"]
+        rows = [('Non-Diabetes', report['0']), ('Diabetes', report['1']), ('Weighted Avg', report['weighted avg'])]
+        report_df = pd.DataFrame({
+            'Kelas': [name for name, _ in rows],
+            'Presisi': [f"{r['precision']:.2f}" for _, r in rows],
+            'Recall': [f"{r['recall']:.2f}" for _, r in rows],
+            'F1-Score': [f"{r['f1-score']:.2f}" for _, r in rows],
+            'Support': [f"{r['support']:.0f}" for _, r in rows]
+        })
+        st.dataframe(report_df, use_container_width=True, hide_index=True)
+        
+        # Skor per fold cross validation
+        st.markdown(f"#### {cv['n_splits']}-Fold Cross Validation")
+        cv_df = pd.DataFrame({
+            'Fold': np.arange(1, cv['n_splits'] + 1),
+            'Akurasi': cv['accuracy'],
+            'F1-Score': cv['f1'],
+            'AUC': cv['roc_auc']
+        }).round(3)
+        st.dataframe(cv_df, use_container_width=True, hide_index=True)
+    
+    # ROC & Precision-Recall Curve (dirender sekali, disimpan di cache)
+    st.markdown('<p class="custom-section">📈 ROC & Precision-Recall Curve</p>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        roc = ev["roc"]
+        show_chart("roc_chart", roc["fpr"], roc["tpr"], ev["auc"])
+    
+    with col2:
+        pr = ev["pr"]
+        show_chart("pr_chart", pr["recall"], pr["precision"], pr["average_precision"])
+    
+    # Kalibrasi probabilitas
+    st.markdown('<p class="custom-section">🎯 Kalibrasi Probabilitas</p>', unsafe_allow_html=True)
+    
+    calib = ev["calibration"]
+    show_chart("calibration_chart", calib["prob_pred"], calib["prob_true"])
+    st.caption(f"Metode kalibrasi: {calib.get('method', 'none')}.")
+    
+    # Ambang kategori risiko (dipilih dari sweep threshold saat training)
+    bands = ev.get("risk_bands")
+    if bands:
+        st.markdown('<p class="custom-section">🎚️ Ambang Kategori Risiko</p>', unsafe_allow_html=True)
+        st.markdown(f'<p class="custom-desc">Ambang <b>SEDANG</b> meminimalkan biaya pada prediksi validasi (1 false negative = {bands["cost_fn"] / bands["cost_fp"]:g}× false positive). Ambang <b>TINGGI</b> adalah ambang terendah dengan presisi ≥ {bands["min_precision"]:.0%}.</p>', unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            st.metric("⚠️ SEDANG", f"> {bands['medium']:.1%}",
+                      f"Presisi {bands['medium_precision']:.0%} · Recall {bands['medium_recall']:.0%}", delta_color="off")
+        with col2:
+            st.metric("🚨 TINGGI", f"> {bands['high']:.1%}",
+                      f"Presisi {bands['high_precision']:.0%} · Recall {bands['high_recall']:.0%}", delta_color="off")
+        
+        sweep = ev["thresholds"]
+        show_chart(
+            "threshold_chart",
+            sweep["threshold"], sweep["precision"], sweep["recall"], sweep["cost"],
+            {"medium": bands["medium"], "high": bands["high"]}
+        )
@@ -0,0 +1,85 @@
+"""Interpretasi Model page: logistic coefficients and their statistics."""
+import streamlit as st
+
+from resources import load_artifact, show_chart
+
+
+# =========================
+# INTERPRETASI MODEL
+# =========================
+def render():
+    st.markdown("""
+    <div class="custom-header">
+        <h1>📘 Interpretasi Model</h1>
+        <p>Pemahaman Hasil Model Regresi Logistik</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="custom-card">', unsafe_allow_html=True)
+    
+    st.markdown('<p class="custom-section">📊 Koefisien Regresi Logistik</p>', unsafe_allow_html=True)
+    st.markdown('<p class="custom-desc">Koefisien dari model Regresi Logistik menunjukkan pengaruh setiap variabel terhadap risiko diabetes. Nilai positif menunjukkan peningkatan risiko, nilai negatif menunjukkan penurunan risiko.</p>', unsafe_allow_html=True)
+    
+    import pandas as pd
+    from scoring import FEATURE_LABELS
+    
+    # Tabel koefisien (dihitung saat training, dibaca dari logistic_model.json)
+    statistics = load_artifact()["statistics"]
+    
+    def significance(p_value):
+        if p_value < 0.001:
+            return '***'
+        if p_value < 0.01:
+            return '**'
+        if p_value < 0.05:
+            return '*'
+        return 'Tidak Signifikan'
+    
+    koef_df = pd.DataFrame({
+        'Variabel': [FEATURE_LABELS[row['feature']] for row in statistics['features']],
+        'Koefisien': [row['coef'] for row in statistics['features']],
+        'Std. Error': [row['std_err'] for row in statistics['features']],
+        'Odds Ratio': [row['odds_ratio'] for row in statistics['features']],
+        'CI 95%': [f"{row['ci_low']:.3f} – {row['ci_high']:.3f}" for row in statistics['features']],
+        'P-value': [row['p_value'] for row in statistics['features']],
+        'Signifikansi': [significance(row['p_value']) for row in statistics['features']]
+    }).round({'Koefisien': 3, 'Std. Error': 3, 'Odds Ratio': 3, 'P-value': 4})
+    st.dataframe(koef_df, use_container_width=True, hide_index=True)
+    st.caption(f"Estimasi {statistics['method']} pada {statistics['n_obs']} pasien data latih. Pseudo R² = {statistics['pseudo_r2']:.3f}.")
+    
+    # Visualisasi koefisien dengan matplotlib
+    st.markdown('<p class="custom-section">📈 Visualisasi Pengaruh Variabel</p>', unsafe_allow_html=True)
+    
+    show_chart(
+        "coefficient_chart",
+        koef_df['Variabel'].tolist(),
+        koef_df['Koefisien'].tolist()
+    )
+    
+    # Interpretasi dalam cards
+    st.markdown('<p class="custom-section">💡 Interpretasi Hasil</p>', unsafe_allow_html=True)
+    
+    # Faktor paling kuat diukur dari statistik Wald |koefisien / std. error|
+    strongest = sorted(statistics['features'], key=lambda row: abs(row['coef'] / row['std_err']), reverse=True)
+    first, second = strongest[0], strongest[1]
+    glucose = next(row for row in statistics['features'] if row['feature'] == 'Glucose')
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown(f"""
+        <div style="background: #f5f3ff; padding: 20px; border-radius: 15px; border-left: 5px solid #7b6cf6;">
+            <h4>🏆 Faktor Risiko Terkuat</h4>
+            <p><b>{FEATURE_LABELS[first['feature']]}</b> (Koefisien: {first['coef']:.3f}, p = {first['p_value']:.2g}) dan <b>{FEATURE_LABELS[second['feature']]}</b> (Koefisien: {second['coef']:.3f}, p = {second['p_value']:.2g}) adalah dua faktor dengan bukti statistik terkuat terhadap risiko diabetes.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div style="background: #fff0f5; padding: 20px; border-radius: 15px; border-left: 5px solid #ec4899;">
+            <h4>📊 Interpretasi Odds Ratio</h4>
+            <p>Setiap peningkatan 1 unit <b>Glukosa</b> meningkatkan odds diabetes sebesar {glucose['odds_ratio'] - 1:.1%} (Odds Ratio: {glucose['odds_ratio']:.3f}, CI 95%: {glucose['ci_low']:.3f} – {glucose['ci_high']:.3f}), dengan asumsi variabel lain konstan.</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,45 @@
+"""Overview Analisis page: project summary and dataset size."""
+import streamlit as st
+
+from resources import load_summary
+
+
+# =========================
+# OVERVIEW ANALISIS
+# =========================
+def render():
+    st.markdown("""
+    <div class="custom-header">
+        <h1>🩺 Analisis Risiko Diabetes</h1>
+        <p>Dashboard Prediksi Risiko Diabetes Menggunakan Regresi Logistik</p>
+    </div>
+    """, unsafe_allow_html=True)
+
+    st.markdown('<div class="custom-card">', unsafe_allow_html=True)
+    
+    st.markdown('<p class="custom-desc">Aplikasi ini dikembangkan untuk <b>menganalisis dan memprediksi risiko diabetes</b> menggunakan metode <b>Regresi Logistik</b>. Dashboard ini menyajikan analisis data kesehatan secara interaktif, informatif, dan mudah dipahami.</p>', unsafe_allow_html=True)
+    
+    st.markdown('<p class="custom-section">📊 Dataset</p>', unsafe_allow_html=True)
+    st.markdown('<p class="custom-desc">💖 Sumber data berasal dari <b>Pima Indians Diabetes Dataset</b>.<br>💖 Dataset berisi variabel medis pasien seperti Glukosa, BMI, Usia, dan variabel klinis lainnya.</p>', unsafe_allow_html=True)
+    
+    # Tampilkan ringkasan dataset
+    summary = load_summary()
+    n_total = summary["n_rows"]
+    n_diabetes = summary["class_counts"][1]
+    n_non_diabetes = summary["class_counts"][0]
+    
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Total Pasien", f"{n_total:,}", "Dataset")
+    with col2:
+        st.metric("Kasus Diabetes", f"{n_diabetes:,}", f"{n_diabetes / n_total:.0%}")
+    with col3:
+        st.metric("Kasus Non-Diabetes", f"{n_non_diabetes:,}", f"{n_non_diabetes / n_total:.0%}")
+    
+    st.markdown('<p class="custom-section">⚙️ Metode</p>', unsafe_allow_html=True)
+    st.markdown('<p class="custom-desc">💖 Metode yang digunakan adalah <b>Regresi Logistik</b>.<br>💖 Metode ini sesuai untuk klasifikasi biner, yaitu pasien diabetes dan tidak diabetes.<br>💖 Model dilatih dengan data historis untuk memprediksi risiko diabetes baru.</p>', unsafe_allow_html=True)
+    
+    st.markdown('<p class="custom-section">🎯 Tujuan</p>', unsafe_allow_html=True)
+    st.markdown('<p class="custom-desc">💖 Mengidentifikasi faktor-faktor yang memengaruhi risiko diabetes.<br>💖 Mengevaluasi performa model prediksi yang dibangun.<br>💖 Memprediksi risiko diabetes pada pasien baru berdasarkan data medis.<br>💖 Memberikan rekomendasi pencegahan berdasarkan hasil prediksi.</p>', unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
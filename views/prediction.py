@@ -0,0 +1,201 @@
+"""Prediksi Baru page: single-patient form and batch CSV scoring."""
+import math
+import time
+
+import streamlit as st
+
+import instrumentation
+import registry
+from resources import (
+    audit_log, drift_monitor, load_explainer, load_model, predict_patient, serving_candidate,
+    show_chart, what_if
+)
+
+# Rentang slider form (label, min, max, default, step, bantuan); juga dipakai
+# sebagai rentang kurva what-if untuk fitur model
+SLIDERS = {
+    "Glucose": ("Glukosa Plasma (mg/dL)", 0, 200, 120, 1,
+                "Kadar glukosa plasma 2 jam dalam tes toleransi glukosa oral"),
+    "BMI": ("Body Mass Index (BMI)", 10.0, 60.0, 25.0, 0.1,
+            "Indeks massa tubuh (berat dalam kg/(tinggi dalam m)²)"),
+    "Age": ("Usia (tahun)", 20, 80, 33, 1, "Usia pasien dalam tahun"),
+    "BloodPressure": ("Tekanan Darah Diastolik (mm Hg)", 0, 130, 72, 1, "Tekanan darah diastolik"),
+    "Pregnancies": ("Jumlah Kehamilan", 0, 15, 2, 1, "Jumlah kali hamil"),
+    "Insulin": ("Insulin Serum (μU/mL)", 0, 850, 80, 5, "Insulin serum 2 jam"),
+    "SkinThickness": ("Ketebalan Kulit Triceps (mm)", 0, 100, 23, 1, "Ketebalan lipatan kulit triceps"),
+    "DiabetesPedigreeFunction": ("Fungsi Silsilah Diabetes", 0.0, 2.5, 0.5, 0.01,
+                                 "Fungsi yang menilai riwayat diabetes")
+}
+# Sama dengan scoring.FEATURES; scoring (pandas) tidak diimpor saat halaman dibuka
+MODEL_FEATURES = ["Glucose", "BMI", "Age", "Pregnancies", "DiabetesPedigreeFunction"]
+WHAT_IF_RANGES = {col: SLIDERS[col][1:3] for col in MODEL_FEATURES}
+
+
+def slider(column):
+    label, low, high, default, step, help_text = SLIDERS[column]
+    return st.slider(label, low, high, default, step, help=help_text)
+
+
+# =========================
+# PREDIKSI BARU
+# =========================
+def render():
+    st.markdown("""
+    <div class="custom-header">
+        <h1>🔮 Prediksi Baru</h1>
+        <p>Prediksi Risiko Diabetes untuk Pasien Baru</p>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    st.markdown('<div class="custom-card">', unsafe_allow_html=True)
+    
+    tab_single, tab_batch = st.tabs(["👤 Satu Pasien", "📂 Batch CSV"])
+    
+    with tab_single:
+        prediction_form()
+    
+    with tab_batch:
+        batch_scoring()
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+
+@st.fragment
+def prediction_form():
+    """Single-patient form; submitting reruns only this fragment"""
+    # Form dalam dua kolom
+    with st.form("prediction_form"):
+        st.markdown('<p class="custom-section">📝 Form Input Data Pasien</p>', unsafe_allow_html=True)
+        st.markdown('<p class="custom-desc">Masukkan data medis pasien untuk memprediksi risiko diabetes. Semua field wajib diisi.</p>', unsafe_allow_html=True)
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### 🩸 Data Medis")
+            glucose = slider("Glucose")
+            bmi = slider("BMI")
+            age = slider("Age")
+            blood_pressure = slider("BloodPressure")
+        
+        with col2:
+            st.markdown("#### 📊 Data Klinis")
+            pregnancies = slider("Pregnancies")
+            insulin = slider("Insulin")
+            skin_thickness = slider("SkinThickness")
+            diabetes_pedigree = slider("DiabetesPedigreeFunction")
+        
+        submitted = st.form_submit_button("💖 Prediksi Risiko Diabetes", use_container_width=True)
+        
+        if submitted:
+            # Skor risiko dari pipeline terlatih, dimemo per profil pasien
+            start = time.perf_counter()
+            with instrumentation.span("predict"):
+                result = predict_patient(glucose, bmi, age, pregnancies, diabetes_pedigree)
+            
+            # Jejak audit (antrean di memori, ditulis thread latar belakang)
+            audit_log().log({
+                "source": "form",
+                "inputs": {
+                    "Glucose": glucose, "BMI": bmi, "Age": age, "Pregnancies": pregnancies,
+                    "DiabetesPedigreeFunction": diabetes_pedigree, "BloodPressure": blood_pressure,
+                    "Insulin": insulin, "SkinThickness": skin_thickness
+                },
+                "risk_score": round(result["risk_score"], 4),
+                "risk_level": result["risk_level"],
+                "model": serving_candidate()[0],
+                "model_version": registry.current_version(),
+                "latency_ms": round((time.perf_counter() - start) * 1000, 3)
+            })
+            
+            # Hasil prediksi
+            st.markdown("---")
+            st.markdown('<p class="custom-section">🎯 Hasil Prediksi</p>', unsafe_allow_html=True)
+            
+            # Tampilkan hasil
+            col_result1, col_result2 = st.columns([2, 1])
+            
+            with col_result1:
+                st.markdown(result["card_html"], unsafe_allow_html=True)
+            
+            with col_result2:
+                st.metric("Kategori Risiko", result["risk_level"])
+            
+            # Progress bar
+            st.progress(result["risk_score"])
+            
+            # Rekomendasi
+            st.markdown("#### 📋 Rekomendasi")
+            st.info(result["recommendation"])
+            st.caption(f"Model: {result['model_label']}. Kategori: SEDANG > {result['bands']['medium']:.1%}, TINGGI > {result['bands']['high']:.1%} (probabilitas terkalibrasi).")
+            
+            # Faktor pendorong: kontribusi log-odds tiap fitur vs pasien rata-rata
+            contributions = result.get("contributions")
+            if contributions:
+                from scoring import TOP_DRIVERS
+
+                st.markdown("#### 🔍 Faktor Pendorong Risiko")
+                calibrated = result["contribution_scale"] == "calibrated_log_odds"
+                for feature, contribution in contributions[:TOP_DRIVERS]:
+                    direction = "⬆️ menaikkan" if contribution > 0 else "⬇️ menurunkan"
+                    effect = f"odds ×{math.exp(contribution):.2f}" if calibrated else f"log-odds model {contribution:+.2f}"
+                    st.markdown(f"- **{feature}** {direction} risiko ({effect})")
+                if calibrated:
+                    st.caption("Dibandingkan pasien dengan nilai rata-rata data latih, pada skala probabilitas terkalibrasi di atas; odds ×1,00 berarti tanpa pengaruh.")
+                else:
+                    st.caption("Dibandingkan pasien dengan nilai rata-rata data latih. Kalibrasi isotonic tidak linear, jadi nilai ini adalah kontribusi log-odds model sebelum kalibrasi, bukan pengali odds probabilitas di atas.")
+            
+            # What-if: seluruh rentang slider tiap fitur dalam satu panggilan predict_proba
+            st.markdown("#### 🧪 Analisis What-If")
+            st.markdown('<p class="custom-desc">Perubahan risiko bila satu variabel digeser sepanjang rentang slider-nya sementara variabel lain tetap. Titik menandai nilai pasien saat ini; garis putus-putus adalah ambang SEDANG dan TINGGI.</p>', unsafe_allow_html=True)
+            with instrumentation.span("what_if"):
+                curves = what_if(glucose, bmi, age, pregnancies, diabetes_pedigree, WHAT_IF_RANGES)
+            show_chart("what_if_chart", curves, result["bands"])
+
+
+@st.fragment
+def batch_scoring():
+    """CSV upload and chunked scoring of every row"""
+    st.markdown('<p class="custom-section">📂 Skoring Batch dari CSV</p>', unsafe_allow_html=True)
+    st.markdown('<p class="custom-desc">Unggah file CSV dengan format yang sama seperti <b>diabetes.csv</b> (dipisahkan <b>;</b>). Nilai 0 pada Glukosa dan BMI diganti median data latih oleh pipeline model, lalu seluruh baris diskor sekaligus per blok. Untuk Regresi Logistik, hasil juga memuat kontribusi log-odds tiap fitur (<code>contrib_*</code>, skalanya di kolom <code>contrib_scale</code>) dan tiga faktor pendorong utama (<code>driver_1</code>–<code>driver_3</code>).</p>', unsafe_allow_html=True)
+    
+    uploaded = st.file_uploader("File CSV Pasien", type=["csv"])
+    chunksize = st.select_slider("Ukuran blok (baris)", [10_000, 50_000, 100_000, 250_000], 50_000)
+    
+    if uploaded is not None and st.button("💖 Skor Semua Pasien", use_container_width=True):
+        from scoring import score_csv_to_text
+        
+        try:
+            with st.spinner("Menghitung skor risiko..."), instrumentation.span("batch_score"):
+                csv_text, summary = score_csv_to_text(
+                    load_model(), uploaded, chunksize, load_explainer(), drift_monitor()
+                )
+        except ValueError as exc:
+            st.error(f"⚠️ {exc}")
+        else:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("Total Baris", f"{summary['rows']:,}")
+            with col2:
+                st.metric("Baris per Detik", f"{summary['rows_per_second']:,.0f}")
+            with col3:
+                st.metric("Waktu Proses", f"{summary['seconds']:.2f} s")
+            
+            counts = summary["counts"]
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric("🚨 TINGGI", f"{counts['TINGGI']:,}")
+            with col2:
+                st.metric("⚠️ SEDANG", f"{counts['SEDANG']:,}")
+            with col3:
+                st.metric("✅ RENDAH", f"{counts['RENDAH']:,}")
+            
+            if summary["preview"] is not None:
+                st.dataframe(summary["preview"], use_container_width=True, hide_index=True)
+            
+            st.download_button(
+                "📥 Unduh Hasil Prediksi",
+                csv_text,
+                file_name="hasil_prediksi.csv",
+                mime="text/csv",
+                use_container_width=True
+            )